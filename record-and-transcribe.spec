@@ -30,7 +30,9 @@ a = Analysis(
     binaries=binaries,
     datas=[
         ('assets/logo.png', 'assets'),
+        ('assets/logo_small.png', 'assets'),
         ('assets/logo.ico', 'assets'),
+        ('src/locales', 'locales'),
     ] + whisper_assets,
     hiddenimports=[
         'whisper',
@@ -38,7 +40,6 @@ a = Analysis(
         'tiktoken_ext.openai_public',
         'sounddevice',
         'numpy',
-        'pydub',
         'PIL',
         'PIL.Image',
         'PIL.ImageTk',
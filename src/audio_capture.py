@@ -4,32 +4,135 @@ Handles microphone and system audio (WASAPI Loopback on Windows,
 BlackHole/Soundflower/Loopback on macOS) recording.
 """
 
+import os
 import sys
+import subprocess
 import sounddevice as sd
 import numpy as np
-import wave
+import struct
 import threading
-import queue
+import time
 from datetime import datetime
 from pathlib import Path
 
 
+def _build_level_lut():
+    """Precompute the 0-100 meter level for every int16 peak magnitude."""
+    # Convert to dB (relative to int16 max) and map -60dB..0dB to 0..100
+    db = 20 * np.log10(np.arange(1, 32769) / 32768)
+    lut = np.zeros(32769, dtype=np.uint8)
+    lut[1:] = np.clip(((db + 60) / 60 * 100).astype(np.int32), 0, 100)
+    return lut
+
+
+class AudioRingBuffer:
+    """
+    Lock-free single-producer/single-consumer ring buffer for audio frames.
+
+    The PortAudio callback is the only writer and the recording thread the
+    only reader. Each side advances just its own counter, so neither has to
+    take a lock. When the buffer is full the incoming block is dropped (and
+    counted in ``overruns``) instead of blocking the realtime thread.
+    """
+
+    def __init__(self, capacity, channels, dtype=np.int16):
+        # Round up to a power of two so positions wrap with a mask, not a modulo
+        capacity = 1 << max(0, capacity - 1).bit_length()
+        self._buffer = np.zeros((capacity, channels), dtype=dtype)
+        self._capacity = capacity
+        self._mask = capacity - 1
+        # Monotonic frame counters; only the writer touches _written and
+        # only the reader touches _read.
+        self._written = 0
+        self._read = 0
+        self.overruns = 0
+
+    @property
+    def capacity(self):
+        """Maximum number of frames the buffer can hold."""
+        return self._capacity
+
+    def __len__(self):
+        """Number of frames available for reading."""
+        return self._written - self._read
+
+    def write(self, data):
+        """
+        Copy frames into the buffer. Returns False if they were dropped.
+
+        A mono (frames, 1) block is broadcast into every channel, so callers
+        never need to build a stereo copy first.
+        """
+        frames = data.shape[0]
+        if frames > self._capacity - (self._written - self._read):
+            self.overruns += 1
+            return False
+        start = self._written & self._mask
+        first = min(frames, self._capacity - start)
+        np.copyto(self._buffer[start:start + first], data[:first], casting='no')
+        if first < frames:
+            np.copyto(self._buffer[:frames - first], data[first:], casting='no')
+        # Publish only after the data is in place
+        self._written += frames
+        return True
+
+    def read(self, max_frames=None):
+        """
+        Copy out up to max_frames frames (all available if None).
+
+        Returns:
+            ndarray of shape (frames, channels), or None if the buffer is empty
+        """
+        available = self._written - self._read
+        frames = available if max_frames is None else min(max_frames, available)
+        if frames <= 0:
+            return None
+        start = self._read & self._mask
+        first = min(frames, self._capacity - start)
+        if first == frames:
+            data = self._buffer[start:start + frames].copy()
+        else:
+            data = np.concatenate((self._buffer[start:], self._buffer[:frames - first]))
+        self._read += frames
+        return data
+
+    def clear(self):
+        """Discard all buffered frames. Only call while the writer is idle."""
+        self._read = self._written
+        self.overruns = 0
+
+
 class AudioCapture:
     """Captures audio from microphone and/or system audio (WASAPI Loopback)."""
 
     SAMPLE_RATE = 44100
     OUTPUT_CHANNELS = 2  # Always output stereo
     DTYPE = np.int16
+    RING_SECONDS = 4  # Capacity of each source's ring buffer
+    STALL_FRAMES = SAMPLE_RATE // 2  # Write one source alone once the other lags this far
+    DRAIN_INTERVAL = 0.1  # Seconds of audio the recording loop batches per pass
+    BATCH_FRAMES = int(SAMPLE_RATE * DRAIN_INTERVAL)  # Buffered frames that wake the loop
+    WRITE_BUFFER_SIZE = 1 << 20  # Bytes buffered before hitting the disk
+    DEVICE_CACHE_TTL = 5.0  # Seconds before the device list is re-enumerated
+    _LEVEL_LUT = _build_level_lut()  # Indexed by peak amplitude 0..32768
 
     def __init__(self):
         self.is_recording = False
         self.mic_stream = None
         self.loopback_stream = None
-        self.mic_queue = queue.Queue()
-        self.loopback_queue = queue.Queue()
+        ring_frames = self.SAMPLE_RATE * self.RING_SECONDS
+        self.mic_ring = AudioRingBuffer(ring_frames, self.OUTPUT_CHANNELS, self.DTYPE)
+        self.loopback_ring = AudioRingBuffer(ring_frames, self.OUTPUT_CHANNELS, self.DTYPE)
+        # Reused by the mixer; a single read never exceeds one ring's capacity
+        mix_frames = self.mic_ring.capacity
+        self._mix_acc = np.empty((mix_frames, self.OUTPUT_CHANNELS), dtype=np.int32)
+        self._mix_out = np.empty((mix_frames, self.OUTPUT_CHANNELS), dtype=self.DTYPE)
         self.recording_thread = None
+        # Set by the callbacks once a batch is buffered, and on stop
+        self._data_event = threading.Event()
         self.output_file = None
         self.wave_file = None
+        self._frames_written = 0
         self.mic_channels = 1
         self.loopback_channels = 2
         # Separate levels for mic and loopback
@@ -41,10 +144,28 @@ class AudioCapture:
         # Preview mode (level monitoring without recording)
         self.is_previewing = False
 
-    @staticmethod
-    def get_input_devices():
+    # Shared by all instances: PortAudio enumeration is process-wide
+    _device_cache = None
+    _device_cache_time = 0.0
+
+    @classmethod
+    def _query_devices(cls):
+        """Return sd.query_devices(), cached for DEVICE_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if cls._device_cache is None or now - cls._device_cache_time > cls.DEVICE_CACHE_TTL:
+            cls._device_cache = sd.query_devices()
+            cls._device_cache_time = now
+        return cls._device_cache
+
+    @classmethod
+    def invalidate_device_cache(cls):
+        """Force the next device lookup to re-enumerate (e.g. on "Refresh Devices")."""
+        cls._device_cache = None
+
+    @classmethod
+    def get_input_devices(cls):
         """Get list of available input devices (microphones)."""
-        devices = sd.query_devices()
+        devices = cls._query_devices()
         input_devices = []
         for i, device in enumerate(devices):
             if device['max_input_channels'] > 0:
@@ -56,14 +177,32 @@ class AudioCapture:
                 })
         return input_devices
 
-    @staticmethod
-    def get_loopback_devices():
+    @classmethod
+    def get_default_input_name(cls):
+        """Get the name of the system default input device, or None.
+
+        Resolves sd.default.device against the cached device list instead
+        of issuing a separate sd.query_devices(kind='input') enumeration.
+        """
+        try:
+            index = sd.default.device[0]
+            devices = cls._query_devices()
+            if index is not None and 0 <= index < len(devices):
+                return devices[index]['name']
+            # No explicit default set: let PortAudio resolve it
+            return sd.query_devices(kind='input')['name']
+        except Exception:
+            pass
+        return None
+
+    @classmethod
+    def get_loopback_devices(cls):
         """Get loopback devices for system audio capture.
 
         Windows: WASAPI Loopback, Stereo Mix, VB-Audio Virtual Cable.
         macOS: BlackHole, Soundflower, Loopback (Rogue Amoeba).
         """
-        devices = sd.query_devices()
+        devices = cls._query_devices()
         loopback_devices = []
 
         # Windows: WASAPI loopback and Stereo Mix
@@ -108,79 +247,121 @@ class AudioCapture:
         """Convert peak amplitude to a 0-100 meter level using dB scaling."""
         if peak < 1:
             return 0
-        # Convert to dB (relative to int16 max)
-        db = 20 * np.log10(peak / 32768)
-        # Map -60dB..0dB to 0..100
-        level = max(0, min(100, int((db + 60) / 60 * 100)))
-        return level
+        return int(AudioCapture._LEVEL_LUT[peak])
+
+    @staticmethod
+    def _block_peak(indata):
+        """Peak absolute amplitude of an int16 block, without an abs() temporary."""
+        return max(-int(indata.min()), int(indata.max()))
 
     def _mic_callback(self, indata, frames, time, status):
         """Callback for microphone stream."""
         if status:
             print(f"Mic callback status: {status}")
 
-        peak = np.max(np.abs(indata))
+        peak = self._block_peak(indata)
         self.mic_level = self._peak_to_level(peak)
 
         if self.is_recording:
-            if self.mic_channels == 1 and indata.shape[1] == 1:
-                stereo_data = np.column_stack((indata, indata))
-                self.mic_queue.put(stereo_data.copy())
-            else:
-                self.mic_queue.put(indata.copy())
+            self.mic_ring.write(indata)
+            if len(self.mic_ring) >= self.BATCH_FRAMES:
+                self._data_event.set()
 
     def _loopback_callback(self, indata, frames, time, status):
         """Callback for loopback/system audio stream."""
         if status:
             print(f"Loopback callback status: {status}")
 
-        peak = np.max(np.abs(indata))
+        peak = self._block_peak(indata)
         self.loopback_level = self._peak_to_level(peak)
 
         if self.is_recording:
-            if self.loopback_channels == 1 and indata.shape[1] == 1:
-                stereo_data = np.column_stack((indata, indata))
-                self.loopback_queue.put(stereo_data.copy())
-            else:
-                self.loopback_queue.put(indata.copy())
+            self.loopback_ring.write(indata)
+            if len(self.loopback_ring) >= self.BATCH_FRAMES:
+                self._data_event.set()
+
+    def _mix(self, mic_data, loopback_data):
+        """Average two equal-length int16 blocks using the preallocated mix buffers."""
+        frames = mic_data.shape[0]
+        acc = self._mix_acc[:frames]
+        mixed = self._mix_out[:frames]
+        np.add(mic_data, loopback_data, out=acc, dtype=np.int32)
+        # The average of two int16 samples always fits in int16, so no clip
+        np.right_shift(acc, 1, out=acc)
+        np.copyto(mixed, acc, casting='unsafe')
+        return mixed
+
+    def _write_frames(self, data):
+        """Append int16 frames to the output file and count them."""
+        if self.wave_file:
+            # Hand the file the array's own memory instead of a bytes copy
+            self.wave_file.write(memoryview(np.ascontiguousarray(data)).cast('B'))
+            self._frames_written += data.shape[0]
+
+    @staticmethod
+    def _raise_thread_priority():
+        """Best-effort priority boost for the calling (recording) thread."""
+        try:
+            if sys.platform == 'win32':
+                import ctypes
+                THREAD_PRIORITY_ABOVE_NORMAL = 1
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL)
+            elif sys.platform.startswith('linux'):
+                # Per-thread on Linux; needs CAP_SYS_NICE, so usually a no-op
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -5)
+        except (OSError, AttributeError):
+            pass
 
     def _recording_loop(self):
         """Main recording loop - mixes and writes audio data to file."""
-        while self.is_recording or not self.mic_queue.empty() or not self.loopback_queue.empty():
+        self._raise_thread_priority()
+        while True:
+            # Sleep until a batch is buffered or recording stops; the timeout
+            # keeps a lone trickling or stalled source moving.
+            self._data_event.wait(self.DRAIN_INTERVAL)
+            self._data_event.clear()
+            still_recording = self.is_recording
             mic_data = None
             loopback_data = None
 
-            if self.mic_active:
-                try:
-                    mic_data = self.mic_queue.get(timeout=0.1)
-                except queue.Empty:
-                    pass
+            if self.mic_active and self.loopback_active and still_recording:
+                # Mix only the overlap so both sources stay aligned
+                frames = min(len(self.mic_ring), len(self.loopback_ring))
+                if frames:
+                    mic_data = self.mic_ring.read(frames)
+                    loopback_data = self.loopback_ring.read(frames)
+                elif len(self.mic_ring) > self.STALL_FRAMES:
+                    mic_data = self.mic_ring.read()
+                elif len(self.loopback_ring) > self.STALL_FRAMES:
+                    loopback_data = self.loopback_ring.read()
+            else:
+                # Single source, or final flush after the streams stopped
+                if self.mic_active:
+                    mic_data = self.mic_ring.read()
+                if self.loopback_active:
+                    loopback_data = self.loopback_ring.read()
 
-            if self.loopback_active:
-                try:
-                    loopback_data = self.loopback_queue.get(timeout=0.1)
-                except queue.Empty:
-                    pass
+            if mic_data is None and loopback_data is None:
+                if not still_recording:
+                    break
+                continue
 
             if mic_data is not None and loopback_data is not None:
-                mic_float = mic_data.astype(np.float32)
-                loopback_float = loopback_data.astype(np.float32)
-                len_mic = mic_float.shape[0]
-                len_loop = loopback_float.shape[0]
-                if len_mic < len_loop:
-                    mic_float = np.pad(mic_float, ((0, len_loop - len_mic), (0, 0)))
-                elif len_loop < len_mic:
-                    loopback_float = np.pad(loopback_float, ((0, len_mic - len_loop), (0, 0)))
-                mixed = (mic_float + loopback_float) / 2
-                mixed = np.clip(mixed, -32768, 32767).astype(np.int16)
-                if self.wave_file:
-                    self.wave_file.writeframes(mixed.tobytes())
+                # Mix the overlap; the longer source's tail is written as-is
+                overlap = min(mic_data.shape[0], loopback_data.shape[0])
+                self._write_frames(self._mix(mic_data[:overlap], loopback_data[:overlap]))
+                if mic_data.shape[0] > overlap:
+                    self._write_frames(mic_data[overlap:])
+                elif loopback_data.shape[0] > overlap:
+                    self._write_frames(loopback_data[overlap:])
             elif mic_data is not None:
-                if self.wave_file:
-                    self.wave_file.writeframes(mic_data.tobytes())
+                self._write_frames(mic_data)
             elif loopback_data is not None:
-                if self.wave_file:
-                    self.wave_file.writeframes(loopback_data.tobytes())
+                self._write_frames(loopback_data)
+
+            if not still_recording:
+                break  # The final flush drained both rings
 
     def start_recording(self, mic_device_index=None, loopback_device_index=None, output_dir=None):
         """
@@ -210,17 +391,20 @@ class AudioCapture:
         self.loopback_active = False
         self.mic_level = 0
         self.loopback_level = 0
+        self.mic_ring.clear()
+        self.loopback_ring.clear()
+        self._frames_written = 0
+        self._data_event.clear()
 
-        self.wave_file = wave.open(str(self.output_file), 'wb')
-        self.wave_file.setnchannels(self.OUTPUT_CHANNELS)
-        self.wave_file.setsampwidth(2)
-        self.wave_file.setframerate(self.SAMPLE_RATE)
+        # Raw PCM after a placeholder header; sizes are patched on close
+        self.wave_file = open(self.output_file, 'wb', buffering=self.WRITE_BUFFER_SIZE)
+        self.wave_file.write(self._wav_header(0))
 
         self.is_recording = True
 
         if mic_device_index is not None:
             try:
-                device_info = sd.query_devices(mic_device_index)
+                device_info = self._query_devices()[mic_device_index]
                 self.mic_channels = min(device_info['max_input_channels'], 2)
                 self.mic_stream = sd.InputStream(
                     device=mic_device_index,
@@ -233,12 +417,12 @@ class AudioCapture:
                 self.mic_active = True
             except Exception as e:
                 self.is_recording = False
-                self.wave_file.close()
+                self._close_output()
                 raise RuntimeError(f"Failed to start microphone stream: {e}")
 
         if loopback_device_index is not None:
             try:
-                device_info = sd.query_devices(loopback_device_index)
+                device_info = self._query_devices()[loopback_device_index]
                 self.loopback_channels = min(device_info['max_input_channels'], 2)
                 self.loopback_stream = sd.InputStream(
                     device=loopback_device_index,
@@ -255,7 +439,7 @@ class AudioCapture:
                     self.mic_stream.close()
                     self.mic_stream = None
                 self.is_recording = False
-                self.wave_file.close()
+                self._close_output()
                 raise RuntimeError(f"Failed to start loopback stream: {e}")
 
         self.recording_thread = threading.Thread(target=self._recording_loop)
@@ -285,21 +469,44 @@ class AudioCapture:
             self.loopback_stream.close()
             self.loopback_stream = None
 
+        # Wake the recording loop for the final flush
+        self._data_event.set()
+
         if self.recording_thread:
             self.recording_thread.join(timeout=2.0)
             self.recording_thread = None
 
+        self._close_output()
+
+        return self.output_file
+
+    def _wav_header(self, data_bytes):
+        """Build the 44-byte PCM RIFF/WAVE header for data_bytes of samples."""
+        sample_width = np.dtype(self.DTYPE).itemsize
+        block_align = self.OUTPUT_CHANNELS * sample_width
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_bytes, b'WAVE',
+            b'fmt ', 16, 1, self.OUTPUT_CHANNELS, self.SAMPLE_RATE,
+            self.SAMPLE_RATE * block_align, block_align, sample_width * 8,
+            b'data', data_bytes
+        )
+
+    def _close_output(self):
+        """Patch the WAV header with the final sizes and close the file."""
         if self.wave_file:
+            data_bytes = self._frames_written * self.OUTPUT_CHANNELS * np.dtype(self.DTYPE).itemsize
+            # RIFF sizes are 32-bit; clamp rather than wrap for >4 GB recordings
+            data_bytes = min(data_bytes, 0xFFFFFFFF - 36)
+            self.wave_file.seek(0)
+            self.wave_file.write(self._wav_header(data_bytes))
             self.wave_file.close()
             self.wave_file = None
 
-        return self.output_file
-
     def get_recording_duration(self):
         """Get current recording duration in seconds."""
-        if self.wave_file and self.is_recording:
-            frames = self.wave_file.getnframes() if hasattr(self.wave_file, 'getnframes') else 0
-            return frames / self.SAMPLE_RATE
+        if self.is_recording:
+            return self._frames_written / self.SAMPLE_RATE
         return 0
 
     def get_current_level(self):
@@ -326,7 +533,7 @@ class AudioCapture:
 
         if mic_device_index is not None:
             try:
-                device_info = sd.query_devices(mic_device_index)
+                device_info = self._query_devices()[mic_device_index]
                 self.mic_channels = min(device_info['max_input_channels'], 2)
                 self.mic_stream = sd.InputStream(
                     device=mic_device_index,
@@ -342,7 +549,7 @@ class AudioCapture:
 
         if loopback_device_index is not None:
             try:
-                device_info = sd.query_devices(loopback_device_index)
+                device_info = self._query_devices()[loopback_device_index]
                 self.loopback_channels = min(device_info['max_input_channels'], 2)
                 self.loopback_stream = sd.InputStream(
                     device=loopback_device_index,
@@ -389,6 +596,9 @@ def convert_to_mp3(wav_path, delete_wav=True):
     """
     Convert WAV file to MP3.
 
+    ffmpeg streams the WAV from disk, so the recording is never loaded
+    into memory as a whole.
+
     Args:
         wav_path: Path to WAV file
         delete_wav: Whether to delete the WAV file after conversion
@@ -396,13 +606,34 @@ def convert_to_mp3(wav_path, delete_wav=True):
     Returns:
         Path to the MP3 file
     """
-    from pydub import AudioSegment
-
     wav_path = Path(wav_path)
     mp3_path = wav_path.with_suffix('.mp3')
 
-    audio = AudioSegment.from_wav(str(wav_path))
-    audio.export(str(mp3_path), format='mp3', bitrate='128k')
+    cmd = [
+        'ffmpeg',
+        '-loglevel', 'error',
+        '-i', str(wav_path),
+        '-acodec', 'libmp3lame',
+        '-b:a', '128k',
+        '-y',
+        str(mp3_path)
+    ]
+
+    try:
+        subprocess.run(
+            cmd,
+            capture_output=True,
+            # ffmpeg writes paths in UTF-8 regardless of the console codepage
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            check=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"MP3 conversion failed: {e.stderr}")
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not found. Please install ffmpeg or place ffmpeg.exe in bundled_ffmpeg/.")
 
     if delete_wav:
         wav_path.unlink()
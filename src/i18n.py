@@ -1,8 +1,17 @@
 """
 Internationalization (i18n) module for Record & Transcribe.
 Simple dict-based translation system supporting English and German.
+English is defined inline; other languages are loaded on demand from
+locales/<lang>.json.
 """
 
+import json
+import string
+import sys
+from enum import IntEnum
+from pathlib import Path
+from types import MappingProxyType
+
 _current_language = 'en'
 
 translations = {
@@ -50,13 +59,14 @@ translations = {
         'devices.mic_level': 'Mic Level:',
         'devices.sys_level': 'Sys Level:',
         'devices.refresh': 'Refresh Devices',
+        'devices.scanning': 'Scanning...',
+        'devices.scan_failed': 'Could not list audio devices: {error}',
 
         # Status
         'status.ready': 'Ready',
         'status.recording': 'Recording...',
         'status.processing': 'Processing...',
         'status.transcribing': 'Transcribing...',
-        'status.extracting_audio': 'Extracting audio...',
         'status.downloading_model': 'Downloading Whisper model (~460 MB)... Please wait.',
         'status.loading_model': 'Loading Whisper model...',
         'status.transcribing_gpu': 'Transcribing with GPU acceleration...',
@@ -130,144 +140,131 @@ translations = {
         'settings.theme': 'Theme:',
         'settings.theme_light': 'Light',
         'settings.theme_dark': 'Dark',
+        'settings.prefer_gpu': 'Use GPU for transcription',
         'settings.restart_title': 'Restart Required',
         'settings.restart_msg': 'Please restart the application for the language change to take effect.',
-    },
-    'de': {
-        # Menu
-        'menu.file': 'Datei',
-        'menu.transcribe_file': 'Datei transkribieren...',
-        'menu.exit': 'Beenden',
-        'menu.help': 'Hilfe',
-        'menu.system_check': 'Systemcheck',
-        'menu.about': '\u00dcber...',
-        'menu.check_updates': 'Update...',
-
-        # System Check
-        'syscheck.title': 'Systemstatus',
-        'syscheck.ffmpeg': 'FFmpeg (MP3-Konvertierung)',
-        'syscheck.ffmpeg_desc': 'Nicht gefunden - MP3-Konvertierung funktioniert evtl. nicht',
-        'syscheck.whisper': 'Whisper (Transkriptions-Engine)',
-        'syscheck.whisper_desc': 'Nicht installiert - Transkription nicht verfügbar',
-        'syscheck.model': 'Whisper-Modell',
-        'syscheck.model_desc': 'Modell "{model}" noch nicht heruntergeladen (~460 MB)',
-        'syscheck.output_dir': 'Ausgabeordner: {path}',
-        'syscheck.loopback': 'System-Audio (Loopback)',
-        'syscheck.loopback_desc': 'Kein Loopback-Ger\u00e4t gefunden - VB-Audio Virtual Cable installieren (kostenlos): vb-audio.com/Cable',
-        'syscheck.gpu': 'GPU-Beschleunigung (CUDA)',
-        'syscheck.gpu_desc': 'Keine NVIDIA-GPU gefunden - CPU wird verwendet (langsamer)',
-        'syscheck.gpu_exe_desc': 'In der .exe nicht verf\u00fcgbar - f\u00fcr GPU-Support aus dem Quellcode starten',
-        'syscheck.gpu_system_desc': 'GPU \u00fcber systemweit installiertes Whisper',
-
-        # GPU Installation
-        'menu.install_gpu': 'GPU-Support installieren...',
-        'gpu.already_installed': 'GPU-Support ist bereits aktiv!\nVerwendet: {gpu}',
-        'gpu.exe_not_supported': 'GPU-Support kann in der portablen .exe nicht installiert werden.\n\nFür GPU-Beschleunigung aus dem Quellcode starten:\n1. pip install torch --index-url https://download.pytorch.org/whl/cu121\n2. python src/recorder.py',
-        'gpu.confirm_install': 'NVIDIA CUDA-Support für schnellere Transkription installieren (~2,5 GB Download).\n\nBenötigt eine NVIDIA-GPU mit CUDA-Unterstützung.\n\nFortfahren?',
-        'gpu.installing': 'GPU-Support wird installiert... Das kann einige Minuten dauern.',
-        'gpu.install_success': 'GPU-Support installiert! App neustarten, um GPU-Beschleunigung zu nutzen.',
-        'gpu.install_failed': 'GPU-Installation fehlgeschlagen:\n{error}',
-
-        # Audio Sources
-        'devices.frame_title': 'Audio-Quellen',
-        'devices.microphone': 'Mikrofon:',
-        'devices.system_audio': 'System-Audio:',
-        'devices.no_microphone': '(Kein Mikrofon)',
-        'devices.no_system_audio': '(Kein System-Audio)',
-        'devices.mic_level': 'Mic-Pegel:',
-        'devices.sys_level': 'Sys-Pegel:',
-        'devices.refresh': 'Geräte aktualisieren',
-
-        # Status
-        'status.ready': 'Bereit',
-        'status.recording': 'Aufnahme läuft...',
-        'status.processing': 'Verarbeite...',
-        'status.transcribing': 'Transkribiere...',
-        'status.extracting_audio': 'Extrahiere Audio...',
-        'status.downloading_model': 'Whisper-Modell wird heruntergeladen (~460 MB)... Bitte warten.',
-        'status.loading_model': 'Whisper-Modell wird geladen...',
-        'status.transcribing_gpu': 'Transkribiere mit GPU-Beschleunigung...',
-        'status.cancelled': 'Abgebrochen',
-
-        # Buttons
-        'button.start_recording': 'Aufnahme starten',
-        'button.stop_recording': 'Aufnahme stoppen',
+    }
+}
 
-        # Duration
-        'duration.label': 'Dauer: {time}',
 
-        # Output folder
-        'output.frame_title': 'Ausgabeordner',
-        'output.browse_title': 'Ausgabeordner wählen',
+# Expose the tables read-only; languages are only added by _load_tables()
+_translations = {lang: MappingProxyType(strings) for lang, strings in translations.items()}
+translations = MappingProxyType(_translations)
 
-        # Transcription
-        'transcription.frame_title': 'Transkription',
-        'transcription.auto_transcribe': 'Automatisch transkribieren',
-        'transcription.language': 'Sprache:',
-        'transcription.model': 'Modell: {model}',
-        'transcription.progress': 'Transkribiere... {percent}%',
-        'transcription.cancel': 'Abbrechen',
-        'transcription.whisper_not_installed': 'Whisper nicht installiert',
-        'transcription.model_first_download': 'Hinweis: Das Whisper-Modell (~460 MB) wird bei der ersten Transkription heruntergeladen. Internetverbindung erforderlich.',
+# Languages other than English live in locales/<lang>.json and are only
+# read (into translations) the first time they are activated.
+AVAILABLE_LANGUAGES = ('en', 'de')
 
-        # Transcription language names
-        'lang.auto': 'Auto',
-        'lang.german': 'Deutsch',
-        'lang.english': 'Englisch',
-        'lang.french': 'Französisch',
-        'lang.spanish': 'Spanisch',
-        'lang.italian': 'Italienisch',
+if hasattr(sys, '_MEIPASS'):
+    _LOCALES_DIR = Path(sys._MEIPASS) / 'locales'
+else:
+    _LOCALES_DIR = Path(__file__).parent / 'locales'
 
-        # Dialogs
-        'dialog.no_source_title': 'Keine Audioquelle',
-        'dialog.no_source_msg': 'Bitte wähle mindestens ein Mikrofon oder System-Audio aus.',
-        'dialog.error': 'Fehler',
-        'dialog.error_start': 'Aufnahme konnte nicht gestartet werden:\n{error}',
-        'dialog.error_processing': 'Verarbeitung fehlgeschlagen:\n{error}',
-        'dialog.error_transcription': 'Transkription fehlgeschlagen:\n{error}',
-        'dialog.done': 'Fertig',
-        'dialog.done_recording': 'Aufnahme gespeichert:\n{file}',
-        'dialog.done_recording_transcript': 'Aufnahme gespeichert:\n{file}\n\nTranskript:\n{transcript}',
-        'dialog.done_transcription': 'Transkript gespeichert:\n{file}',
+# Flat lookup tables: every key gets an integer id (its position in the
+# English table), and each language is a tuple indexed by that id with
+# English filling any gaps. A lookup is then one dict probe + one subscript.
+# Keys and values are interned so identical strings share one object.
+_KEY_IDS = {sys.intern(key): i for i, key in enumerate(translations['en'])}
 
-        # File dialog
-        'filedialog.transcribe_title': 'Datei zum Transkribieren auswählen',
-        'filedialog.audio_video': 'Audio/Video Dateien',
-        'filedialog.audio': 'Audio Dateien',
-        'filedialog.video': 'Video Dateien',
-        'filedialog.all': 'Alle Dateien',
+# The same ids as an enum ('menu.file' -> K.MENU_FILE) for use with t_id()
+K = IntEnum('K', {key.replace('.', '_').upper(): i for key, i in _KEY_IDS.items()})
 
-        # About
-        'about.description': 'Einfacher Audio-Recorder mit integrierter Transkription.\nMeetings, Interviews oder beliebiges Audio aufnehmen\nund lokal mit OpenAI Whisper transkribieren.',
-        'about.license': 'Lizenz: GPL-3.0',
-        'about.author': 'von conversion-traffic.de',
 
-        # Update
-        'update.title': 'Update verf\u00fcgbar',
-        'update.downloading': 'Update wird heruntergeladen...',
-        'update.ready': 'Version {version} ist bereit zur Installation!\n\nJetzt installieren und neustarten?',
-        'update.failed': 'Update-Pr\u00fcfung fehlgeschlagen.',
-        'update.up_to_date': 'Du verwendest die neueste Version (v{version}).',
-        'update.install_btn': 'Installieren & Neustarten',
-        'update.later_btn': 'Sp\u00e4ter',
+def _compile_format(text: str):
+    """
+    Precompile a str.format template into a function of the kwargs dict.
 
-        # Settings
-        'settings.frame_title': 'Einstellungen',
-        'settings.ui_language': 'Oberfläche:',
-        'settings.theme': 'Design:',
-        'settings.theme_light': 'Hell',
-        'settings.theme_dark': 'Dunkel',
-        'settings.restart_title': 'Neustart erforderlich',
-        'settings.restart_msg': 'Bitte starte die Anwendung neu, damit die Sprachänderung wirksam wird.',
-    }
-}
+    Plain {name} fields become a %-template, which is much cheaper to fill
+    than re-parsing the format string on every call. Strings using format
+    specs or conversions fall back to str.format.
+    """
+    template = []
+    fields = []
+    for literal, field, spec, conversion in string.Formatter().parse(text):
+        template.append(literal.replace('%', '%%'))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return lambda kwargs: text.format(**kwargs)
+        template.append('%s')
+        fields.append(field)
+    template = ''.join(template)
+    fields = tuple(fields)
+    return lambda kwargs: template % tuple([kwargs[name] for name in fields])
+
+
+# Per language: the flat tuple, a parallel tuple of precompiled formatters
+# (None for static strings, which never get formatted), and the same
+# strings as a key -> string dict for the common no-kwargs path.
+_TABLES: dict[str, tuple] = {}
+_FORMATTERS: dict[str, tuple] = {}
+_RESOLVED: dict[str, dict] = {}
+
+
+def _load_tables(lang: str) -> bool:
+    """Build the lookup tables for a language, reading its JSON file if needed."""
+    if lang in _TABLES:
+        return True
+    if lang not in _translations:
+        try:
+            with open(_LOCALES_DIR / f'{lang}.json', 'r', encoding='utf-8') as f:
+                strings = json.load(f)
+            # Intern on load so strings equal to English (or to each other)
+            # are stored once, shared by the raw and flattened tables
+            _translations[lang] = MappingProxyType(
+                {sys.intern(key): sys.intern(text) for key, text in strings.items()}
+            )
+        except (OSError, ValueError):
+            return False
+    en = translations['en']
+    strings = translations[lang]
+    table = tuple(sys.intern(strings.get(key, en[key])) for key in _KEY_IDS)
+    _TABLES[lang] = table
+    _FORMATTERS[lang] = tuple(_compile_format(text) if '{' in text else None for text in table)
+    _RESOLVED[lang] = dict(zip(_KEY_IDS, table))
+    return True
+
+
+_load_tables('en')
+_current_table = _TABLES['en']
+_current_formatters = _FORMATTERS['en']
+_current_strings = _RESOLVED['en']
+
+# Formatted results for the active language, keyed by (key id, kwargs).
+# Redraws request the same progress/duration strings over and over.
+_FORMAT_CACHE_SIZE = 512
+_format_cache: dict[tuple, str] = {}
+
+
+def _format(index: int, kwargs: dict) -> str:
+    """Format the active language's string for a key id, memoizing the result."""
+    try:
+        # Values are keyed with their type: 1, True and 1.0 compare equal
+        # but format differently
+        cache_key = (index, tuple((k, type(v), v) for k, v in kwargs.items()))
+        return _format_cache[cache_key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable argument - format without caching
+        return _current_formatters[index](kwargs)
+    text = _current_formatters[index](kwargs)
+    if len(_format_cache) >= _FORMAT_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _format_cache[next(iter(_format_cache))]
+    _format_cache[cache_key] = text
+    return text
 
 
 def set_language(lang: str):
     """Set the active UI language. Supported: 'en', 'de'."""
-    global _current_language
-    if lang in translations:
+    global _current_language, _current_table, _current_formatters, _current_strings
+    if lang in AVAILABLE_LANGUAGES and _load_tables(lang):
         _current_language = lang
+        _current_table = _TABLES[lang]
+        _current_formatters = _FORMATTERS[lang]
+        _current_strings = _RESOLVED[lang]
+        _format_cache.clear()
 
 
 def get_language() -> str:
@@ -275,20 +272,96 @@ def get_language() -> str:
     return _current_language
 
 
-def t(key: str, **kwargs) -> str:
+def key_id(key: str) -> int:
+    """Get the integer id of a translation key (same as its K member), for use with t_id()."""
+    return _KEY_IDS[key]
+
+
+def t(key: str) -> str:
     """
     Get translated string for the given key.
 
     Args:
         key: Translation key (e.g. 'menu.file')
-        **kwargs: Format parameters (e.g. time='00:00:00')
 
     Returns:
         Translated string, or the key itself if not found.
     """
-    text = translations.get(_current_language, translations['en']).get(key)
-    if text is None:
-        text = translations['en'].get(key, key)
-    if kwargs:
-        text = text.format(**kwargs)
-    return text
+    return _current_strings.get(key, key)
+
+
+def t_many(keys) -> list[str]:
+    """Translate several keys in one call (e.g. while building a menu)."""
+    strings = _current_strings
+    return [strings.get(key, key) for key in keys]
+
+
+def tf(key: str, **kwargs) -> str:
+    """
+    Get translated string for the given key, filled with format parameters.
+
+    Args:
+        key: Translation key (e.g. 'duration.label')
+        **kwargs: Format parameters (e.g. time='00:00:00')
+
+    Returns:
+        Formatted string, or the formatted key itself if not found.
+    """
+    index = _KEY_IDS.get(key)
+    if index is None:
+        return key.format(**kwargs)
+    if _current_formatters[index] is not None:
+        return _format(index, kwargs)
+    return _current_table[index]
+
+
+def t_id(key_id: int) -> str:
+    """
+    Get translated string by key id (a K member or key_id()), skipping the key lookup.
+
+    Meant for hot paths that resolve the id once and translate repeatedly.
+    """
+    return _current_table[key_id]
+
+
+def tf_id(key_id: int, **kwargs) -> str:
+    """Formatting counterpart of t_id() (see tf())."""
+    if _current_formatters[key_id] is not None:
+        return _format(key_id, kwargs)
+    return _current_table[key_id]
+
+
+if __name__ == "__main__":
+    # Check that every key used in the sources exists and every language
+    # file is complete, so the "key itself" fallback in t() never fires.
+    import re
+
+    call_pattern = re.compile(r"\bt[f]?\(\s*'([^']+)'")
+    enum_pattern = re.compile(r"\bK\.([A-Z][A-Z0-9_]*)")
+    problems = 0
+    for source in sorted(Path(__file__).parent.glob('*.py')):
+        text = source.read_text(encoding='utf-8')
+        for key in call_pattern.findall(text):
+            if key not in _KEY_IDS:
+                print(f"{source.name}: unknown key '{key}'")
+                problems += 1
+        for name in enum_pattern.findall(text):
+            if name not in K.__members__:
+                print(f"{source.name}: unknown key K.{name}")
+                problems += 1
+
+    for lang in AVAILABLE_LANGUAGES:
+        if not _load_tables(lang):
+            print(f"{lang}: locale file not found")
+            problems += 1
+            continue
+        strings = translations[lang]
+        for key in _KEY_IDS.keys() - strings.keys():
+            print(f"{lang}: missing '{key}'")
+            problems += 1
+        for key in strings.keys() - _KEY_IDS.keys():
+            print(f"{lang}: unused '{key}'")
+            problems += 1
+
+    print("OK" if not problems else f"{problems} problem(s) found")
+    sys.exit(1 if problems else 0)
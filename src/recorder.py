@@ -14,15 +14,19 @@ from tkinter import messagebox, filedialog
 import threading
 import time
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
-from i18n import t, set_language, get_language
+from i18n import t, t_many, tf, tf_id, K, set_language, get_language
 from audio_capture import AudioCapture, convert_to_mp3
-from transcriber import Transcriber, check_whisper_installed, check_whisper_model_cached, extract_audio_from_video, check_system_whisper_gpu
+from transcriber import Transcriber, check_whisper_installed, check_whisper_model_cached, check_system_whisper_gpu, invalidate_whisper_cache, set_gpu_probe_file
 from widgets import RoundedButton
 from update_checker import check_for_updates, download_update
 
 
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller."""
     if hasattr(sys, '_MEIPASS'):
@@ -30,6 +34,7 @@ def get_resource_path(relative_path):
     return Path(__file__).parent.parent / relative_path
 
 
+@lru_cache(maxsize=None)
 def get_config_dir():
     """Get config directory. Uses AppData when installed in Program Files, otherwise next to exe."""
     if hasattr(sys, '_MEIPASS'):
@@ -64,6 +69,10 @@ setup_ffmpeg()
 CONFIG_FILE = get_config_dir() / 'config.json'
 DEFAULT_OUTPUT_DIR = Path.home() / 'Documents' / 'Record & Transcribe'
 LOGO_PATH = get_resource_path('assets' / Path('logo.png'))
+LOGO_SMALL_PATH = get_resource_path('assets' / Path('logo_small.png'))  # Pre-sized to 35px high
+
+# System whisper GPU probe result is kept next to the config
+set_gpu_probe_file(get_config_dir() / 'gpu_probe.json')
 
 # Platform-aware font
 SYSTEM_FONT = 'Helvetica Neue' if sys.platform == 'darwin' else 'Segoe UI'
@@ -143,11 +152,17 @@ class RecordAndTranscribeApp:
     THEME_DARK = 'ct-dark'
     THEME_LIGHT = 'ct-light'
 
+    # Level meter refresh (~15 Hz) and minimum change (0-100 scale) to redraw
+    LEVEL_INTERVAL_MS = 66
+    LEVEL_DELTA = 2
+
     def __init__(self, root):
         self.root = root
 
         # Load config (need language before building UI)
         self.config = self._load_config()
+        self._config_dirty = False
+        self._config_after_id = None
 
         # Apply saved UI language
         ui_lang = self.config.get('ui_language', 'en')
@@ -155,31 +170,56 @@ class RecordAndTranscribeApp:
 
         # Initialize components
         self.audio_capture = AudioCapture()
-        self.transcriber = Transcriber(model='small')
+        # One worker: recording/transcription jobs queue behind a single warm model
+        self._transcribe_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='transcribe')
+        self.transcriber = Transcriber(
+            model='small',
+            prefer_gpu=self.config.get('prefer_gpu', True),
+            compute_type=self.config.get('compute_type')
+        )
 
         # State
         self.is_recording = False
         self.is_transcribing = False
         self.recording_start_time = None
-        self.timer_thread = None
+        self._timer_after_id = None
         self.current_wav_file = None
         self.level_update_id = None
+        self._preview_devices = None  # (mic_index, sys_index) of the running preview
+        self._last_mic_shown = 0
+        self._shown_percent = 0  # Transcription percent on screen, None while indeterminate
+        self._pending_progress = None  # Latest percent posted by the transcription thread
+        self._progress_drain_queued = False
+        self._last_sys_shown = 0
+
+        # Transcription language labels, keyed by UI language
+        self._lang_labels_cache = {}
 
         # Device lists
         self.mic_devices = []
+        self._non_loopback_mics = []  # mic_combo entries after "(No Microphone)"
         self.loopback_devices = []
 
         self._create_menu()
         self._create_widgets()
+        # Device scan runs in the background and starts the preview when done
         self._refresh_devices()
 
-        # Start preview for live levels
-        self._start_preview()
+        # Live level meters
         self._update_audio_level_preview()
 
         # Cleanup on window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
+        # Load and warm up an already downloaded Whisper model in the background
+        # so the first transcription after launch skips the cold start. Started
+        # once Tk is idle, so importing torch doesn't compete with the window
+        # coming up.
+        if self.config.get('auto_transcribe', True):
+            self.root.after_idle(lambda: threading.Thread(
+                target=self.transcriber.preload, daemon=True
+            ).start())
+
         # Check for updates (non-blocking, Windows only - uses GitHub releases with .exe)
         if sys.platform == 'win32':
             self._check_for_updates()
@@ -191,6 +231,7 @@ class RecordAndTranscribeApp:
         # Stop recording if active
         if self.is_recording:
             self.is_recording = False
+            self._stop_timer()
             try:
                 self.audio_capture.stop_recording()
             except Exception:
@@ -198,20 +239,37 @@ class RecordAndTranscribeApp:
         # Cancel transcription if active
         if self.is_transcribing:
             self.transcriber.cancel()
+        # Write any pending config change before the process exits
+        self._flush_config(durable=True)
         self.root.destroy()
         # Force exit to kill any remaining threads
         os._exit(0)
 
     @staticmethod
-    def _open_in_explorer(file_path):
+    def _popen_detached(args):
+        """Launch a process fully detached from this one (no inherited stdio)."""
+        kwargs = dict(
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+        )
+        if sys.platform == 'win32':
+            kwargs['creationflags'] = subprocess.DETACHED_PROCESS
+        else:
+            kwargs['start_new_session'] = True
+        return subprocess.Popen(args, **kwargs)
+
+    @classmethod
+    def _open_in_explorer(cls, file_path):
         """Open the containing folder in the file manager and select the file."""
         try:
             if sys.platform == 'darwin':
-                subprocess.Popen(['open', '-R', str(Path(file_path))])
+                cls._popen_detached(['open', '-R', str(Path(file_path))])
             elif sys.platform == 'win32':
-                subprocess.Popen(['explorer', '/select,', str(Path(file_path))])
+                cls._popen_detached(['explorer', '/select,', str(Path(file_path))])
             else:
-                subprocess.Popen(['xdg-open', str(Path(file_path).parent)])
+                cls._popen_detached(['xdg-open', str(Path(file_path).parent)])
         except Exception:
             pass
 
@@ -236,7 +294,7 @@ class RecordAndTranscribeApp:
         for display_name, code in self.UI_LANGUAGES.items():
             lang_menu.add_command(
                 label=display_name,
-                command=lambda c=code: self._set_ui_language(c)
+                command=partial(self._set_ui_language, code)
             )
 
         # Theme submenu
@@ -244,11 +302,19 @@ class RecordAndTranscribeApp:
         settings_menu.add_cascade(label=t('settings.theme'), menu=theme_menu)
         theme_menu.add_command(
             label=t('settings.theme_light'),
-            command=lambda: self._set_theme(self.THEME_LIGHT)
+            command=partial(self._set_theme, self.THEME_LIGHT)
         )
         theme_menu.add_command(
             label=t('settings.theme_dark'),
-            command=lambda: self._set_theme(self.THEME_DARK)
+            command=partial(self._set_theme, self.THEME_DARK)
+        )
+
+        # GPU toggle (lets laptop users force CPU transcription)
+        self.prefer_gpu_var = tk.BooleanVar(value=self.config.get('prefer_gpu', True))
+        settings_menu.add_checkbutton(
+            label=t('settings.prefer_gpu'),
+            variable=self.prefer_gpu_var,
+            command=self._set_prefer_gpu
         )
 
         # Help menu with system check
@@ -275,7 +341,28 @@ class RecordAndTranscribeApp:
             return False, None
 
     def _show_system_check(self):
-        """Show a dialog with system status checks."""
+        """Run system status checks in the background, then show a dialog.
+
+        The whisper and torch probes import multi-hundred-MB packages on
+        first use, so they run off the Tk thread to keep the window live.
+        """
+        output_dir = self.output_dir_var.get()
+        self.root.config(cursor='watch')
+
+        def run():
+            checks, error = None, ''
+            try:
+                checks = self._collect_system_checks()
+            except Exception as e:
+                error = str(e)
+            finally:
+                # Always hand back to the Tk thread, which resets the cursor
+                self.root.after(0, lambda: self._show_system_check_result(checks, output_dir, error))
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _collect_system_checks(self):
+        """Collect (name, ok, description) tuples for the system check dialog."""
         import shutil
 
         checks = []
@@ -290,7 +377,7 @@ class RecordAndTranscribeApp:
 
         # Whisper Model
         model_ok = check_whisper_model_cached(self.transcriber.model_name)
-        model_desc = t('syscheck.model_desc', model=self.transcriber.model_name)
+        model_desc = tf('syscheck.model_desc', model=self.transcriber.model_name)
         checks.append((t('syscheck.model'), model_ok, model_desc))
 
         # System Audio (Loopback)
@@ -310,6 +397,15 @@ class RecordAndTranscribeApp:
         else:
             checks.append((t('syscheck.gpu'), False, t('syscheck.gpu_desc')))
 
+        return checks
+
+    def _show_system_check_result(self, checks, output_dir, error=''):
+        """Show the system check dialog for collected results (checks is None on failure)."""
+        self.root.config(cursor='')
+        if checks is None:
+            messagebox.showerror(t('dialog.error'), error)
+            return
+
         # Build message
         lines = [t('syscheck.title'), '']
         for name, ok, desc in checks:
@@ -318,7 +414,7 @@ class RecordAndTranscribeApp:
             if not ok and desc:
                 lines.append(f'      {desc}')
         lines.append('')
-        lines.append(t('syscheck.output_dir', path=self.output_dir_var.get()))
+        lines.append(tf('syscheck.output_dir', path=output_dir))
 
         messagebox.showinfo(t('menu.system_check'), '\n'.join(lines))
 
@@ -329,7 +425,7 @@ class RecordAndTranscribeApp:
         if cuda_ok:
             messagebox.showinfo(
                 t('menu.install_gpu'),
-                t('gpu.already_installed', gpu=gpu_name)
+                tf('gpu.already_installed', gpu=gpu_name)
             )
             return
 
@@ -349,17 +445,36 @@ class RecordAndTranscribeApp:
             return
 
         self.status_var.set(t('gpu.installing'))
-        self.root.update()
+        self.root.update_idletasks()
 
         def install():
             try:
-                result = subprocess.run(
+                # Stream pip's output and keep only a short tail for error
+                # reporting instead of buffering the whole download log.
+                proc = subprocess.Popen(
                     [sys.executable, '-m', 'pip', 'install',
                      'torch', 'torchvision', 'torchaudio',
                      '--index-url', 'https://download.pytorch.org/whl/cu121'],
-                    capture_output=True, text=True, timeout=600
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    text=True, encoding='utf-8', errors='replace', bufsize=1
                 )
-                if result.returncode == 0:
+                killer = threading.Timer(600, proc.kill)
+                killer.start()
+                tail = deque(maxlen=200)
+                try:
+                    for line in proc.stdout:
+                        tail.append(line.rstrip())
+                    returncode = proc.wait()
+                except BaseException:
+                    # Don't leave pip running once the timer is cancelled
+                    proc.kill()
+                    raise
+                finally:
+                    killer.cancel()
+                    proc.stdout.close()
+                output = '\n'.join(tail)
+                if returncode == 0:
+                    invalidate_whisper_cache()
                     self.root.after(0, lambda: (
                         self.status_var.set(t('status.ready')),
                         messagebox.showinfo(
@@ -372,13 +487,14 @@ class RecordAndTranscribeApp:
                         self.status_var.set(t('status.ready')),
                         messagebox.showerror(
                             t('dialog.error'),
-                            t('gpu.install_failed', error=result.stderr[-500:] if result.stderr else 'Unknown error')
+                            tf('gpu.install_failed', error=output[-500:] if output else 'Unknown error')
                         )
                     ))
             except Exception as e:
+                msg = str(e)
                 self.root.after(0, lambda: (
                     self.status_var.set(t('status.ready')),
-                    messagebox.showerror(t('dialog.error'), str(e))
+                    messagebox.showerror(t('dialog.error'), msg)
                 ))
 
         threading.Thread(target=install, daemon=True).start()
@@ -413,7 +529,7 @@ class RecordAndTranscribeApp:
             elif manual:
                 self.root.after(0, lambda: messagebox.showinfo(
                     t('update.title'),
-                    t('update.up_to_date', version=APP_VERSION)
+                    tf('update.up_to_date', version=APP_VERSION)
                 ))
 
         check_for_updates(APP_VERSION, on_result)
@@ -427,11 +543,11 @@ class RecordAndTranscribeApp:
         self.status_var.set(t('status.ready'))
         result = messagebox.askyesno(
             t('update.title'),
-            t('update.ready', version=version)
+            tf('update.ready', version=version)
         )
         if result:
             try:
-                subprocess.Popen([installer_path])
+                self._popen_detached([installer_path])
                 self._on_close()
             except Exception:
                 pass
@@ -443,7 +559,8 @@ class RecordAndTranscribeApp:
             'auto_transcribe': True,
             'language': 'Auto',
             'ui_language': 'en',
-            'theme': 'ct-light'
+            'theme': 'ct-light',
+            'prefer_gpu': True
         }
         if CONFIG_FILE.exists():
             try:
@@ -462,9 +579,41 @@ class RecordAndTranscribeApp:
         self.config['output_dir'] = self.output_dir_var.get()
         self.config['auto_transcribe'] = self.auto_transcribe_var.get()
         self.config['language'] = self.lang_var.get()
+        self._schedule_config_save()
+
+    def _schedule_config_save(self):
+        """Mark config dirty and coalesce disk writes into one after 500ms."""
+        self._config_dirty = True
+        if self._config_after_id is not None:
+            self.root.after_cancel(self._config_after_id)
+        self._config_after_id = self.root.after(500, self._flush_config)
+
+    def _flush_config(self, durable=False):
+        """Write config to disk atomically if it has unsaved changes.
+
+        Args:
+            durable: fsync the file before replacing (used on shutdown only)
+        """
+        if self._config_after_id is not None:
+            try:
+                self.root.after_cancel(self._config_after_id)
+            except Exception:
+                pass
+            self._config_after_id = None
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            data = json.dumps(self.config, indent=2, ensure_ascii=False).encode('utf-8')
+            if durable:
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                tmp_file.write_bytes(data)
+            os.replace(tmp_file, CONFIG_FILE)
         except Exception:
             pass
 
@@ -483,15 +632,20 @@ class RecordAndTranscribeApp:
             self._save_config()
 
     def _get_language_labels(self):
-        """Get transcription language labels based on current UI language."""
-        return {
-            t('lang.auto'): None,
-            t('lang.german'): 'German',
-            t('lang.english'): 'English',
-            t('lang.french'): 'French',
-            t('lang.spanish'): 'Spanish',
-            t('lang.italian'): 'Italian',
-        }
+        """Get transcription language labels based on current UI language.
+
+        Built once per UI language; callers must not mutate the result.
+        """
+        lang = get_language()
+        labels = self._lang_labels_cache.get(lang)
+        if labels is None:
+            names = t_many([
+                'lang.auto', 'lang.german', 'lang.english',
+                'lang.french', 'lang.spanish', 'lang.italian',
+            ])
+            labels = dict(zip(names, [None, 'German', 'English', 'French', 'Spanish', 'Italian']))
+            self._lang_labels_cache[lang] = labels
+        return labels
 
     def _create_widgets(self):
         """Create all GUI widgets."""
@@ -503,8 +657,13 @@ class RecordAndTranscribeApp:
         header_frame.pack(fill=tk.X, pady=(0, 15), anchor=tk.W)
 
         try:
-            from PIL import Image, ImageTk
-            if LOGO_PATH.exists():
+            if LOGO_SMALL_PATH.exists():
+                # Tk decodes PNG natively; no Pillow decode/resize at startup
+                self.logo_photo = tk.PhotoImage(file=str(LOGO_SMALL_PATH))
+                logo_label = ttk.Label(header_frame, image=self.logo_photo)
+                logo_label.pack(side=tk.LEFT, padx=(0, 12))
+            elif LOGO_PATH.exists():
+                from PIL import Image, ImageTk
                 img = Image.open(LOGO_PATH)
                 max_height = 35
                 ratio = max_height / img.height
@@ -638,7 +797,7 @@ class RecordAndTranscribeApp:
         self._rounded_buttons.append(self.record_btn)
 
         # Duration label
-        self.duration_var = tk.StringVar(value=t('duration.label', time='00:00:00'))
+        self.duration_var = tk.StringVar(value=tf('duration.label', time='00:00:00'))
         self.duration_label = ttk.Label(
             main_frame,
             textvariable=self.duration_var,
@@ -713,7 +872,7 @@ class RecordAndTranscribeApp:
         # Model info
         model_label = ttk.Label(
             trans_inner,
-            text=t('transcription.model', model=self.transcriber.model_name),
+            text=tf('transcription.model', model=self.transcriber.model_name),
             font=(SYSTEM_FONT, 8),
             foreground='gray'
         )
@@ -724,7 +883,7 @@ class RecordAndTranscribeApp:
 
         self.trans_progress_label = ttk.Label(
             self.trans_progress_frame,
-            text=t('transcription.progress', percent=0),
+            text=tf('transcription.progress', percent=0),
             font=(SYSTEM_FONT, 9)
         )
         self.trans_progress_label.pack(anchor=tk.W)
@@ -779,51 +938,77 @@ class RecordAndTranscribeApp:
         # Update rounded button canvas backgrounds
         for btn in self._rounded_buttons:
             btn.update_theme_bg()
-        try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-        except Exception:
-            pass
+        self._schedule_config_save()
+
+    def _set_prefer_gpu(self):
+        """Apply the GPU preference to the transcriber and save to config."""
+        prefer_gpu = self.prefer_gpu_var.get()
+        self.config['prefer_gpu'] = prefer_gpu
+        self._schedule_config_save()
+        # May wait for a model preload to finish, so keep it off the Tk thread
+        threading.Thread(target=self.transcriber.set_prefer_gpu, args=(prefer_gpu,), daemon=True).start()
 
     def _set_ui_language(self, lang_code):
         """Set UI language, save config, and show restart message."""
         self.config['ui_language'] = lang_code
-        try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-        except Exception:
-            pass
+        self._schedule_config_save()
         messagebox.showinfo(
             t('settings.restart_title'),
             t('settings.restart_msg')
         )
 
     def _refresh_devices(self):
-        """Refresh the list of available audio devices."""
-        import sounddevice as sd
-
-        self.mic_devices = AudioCapture.get_input_devices()
+        """Rescan audio devices in the background and repopulate the comboboxes.
+
+        Device enumeration goes through the OS audio API, which can take
+        hundreds of ms on WASAPI, so it runs in a worker thread and the
+        result is applied on the Tk thread.
+        """
+        scanning = t('devices.scanning')
+        self.mic_var.set(scanning)
+        self.sys_var.set(scanning)
+        threading.Thread(target=self._enumerate_devices_worker, daemon=True).start()
+
+    def _enumerate_devices_worker(self):
+        """Query audio devices (worker thread) and hand them to the Tk thread."""
+        mic_devices, loopback_devices, default_name, error = [], [], None, None
+        try:
+            # One enumeration, partitioned by the cached AudioCapture helpers
+            AudioCapture.invalidate_device_cache()
+            mic_devices = AudioCapture.get_input_devices()
+            loopback_devices = AudioCapture.get_loopback_devices()
+            default_name = AudioCapture.get_default_input_name()
+        except Exception as e:
+            # PortAudio errors, a device unplugged mid-scan, ...
+            mic_devices, loopback_devices, default_name, error = [], [], None, str(e)
+        finally:
+            # Always hand back, so the comboboxes never stay on "Scanning..."
+            self.root.after(0, self._apply_device_lists,
+                            mic_devices, loopback_devices, default_name, error)
+
+    def _apply_device_lists(self, mic_devices, loopback_devices, default_name, error=None):
+        """Fill the device comboboxes from a finished scan (empty lists if it failed)."""
+        if error is not None:
+            self.status_var.set(tf('devices.scan_failed', error=error))
+        self.mic_devices = mic_devices
         non_loopback_mics = [d for d in self.mic_devices if not d.get('is_loopback')]
+        self._non_loopback_mics = non_loopback_mics
         mic_names = [t('devices.no_microphone')] + [d['name'] for d in non_loopback_mics]
         self.mic_combo['values'] = mic_names
 
         # Auto-select default input device
         default_mic_idx = 0
-        try:
-            default_input = sd.query_devices(kind='input')
-            default_name = default_input['name']
+        if default_name:
             for i, d in enumerate(non_loopback_mics):
                 if d['name'] == default_name or default_name in d['name']:
                     default_mic_idx = i + 1
                     break
-        except Exception:
-            pass
         if default_mic_idx == 0 and len(mic_names) > 1:
             default_mic_idx = 1
         self.mic_combo.current(default_mic_idx)
 
         # Get loopback devices
-        self.loopback_devices = AudioCapture.get_loopback_devices()
+        self.loopback_devices = loopback_devices
         sys_names = [t('devices.no_system_audio')] + [d['name'] for d in self.loopback_devices]
         self.sys_combo['values'] = sys_names
 
@@ -832,9 +1017,10 @@ class RecordAndTranscribeApp:
         else:
             self.sys_combo.current(0)
 
-        # Restart preview with new devices
-        if not self.is_recording:
-            self._start_preview()
+        # Restart preview with new devices; a rescan always reopens the
+        # streams in case a device died or came back at the same index
+        if error is None and not self.is_recording:
+            self._start_preview(force=True)
 
     def _toggle_recording(self):
         """Start or stop recording."""
@@ -867,7 +1053,7 @@ class RecordAndTranscribeApp:
             )
 
             self.is_recording = True
-            self.recording_start_time = time.time()
+            self.recording_start_time = time.monotonic()
 
             self.status_var.set(t('status.recording'))
             self.record_btn.configure(text=t('button.stop_recording'), bg_color='#FFB300', fg_color='#012b45')
@@ -879,69 +1065,75 @@ class RecordAndTranscribeApp:
         except Exception as e:
             messagebox.showerror(
                 t('dialog.error'),
-                t('dialog.error_start', error=str(e))
+                tf('dialog.error_start', error=str(e))
             )
 
     def _stop_recording(self):
         """Stop audio recording."""
         self.is_recording = False
 
-        if self.timer_thread:
-            self.timer_thread = None
+        self._stop_timer()
 
         wav_file = self.audio_capture.stop_recording()
 
         self.status_var.set(t('status.processing'))
         self.record_btn.configure(state='disabled')
-        self.root.update()
+        self.root.update_idletasks()
 
         def process():
             try:
-                mp3_file = convert_to_mp3(wav_file, delete_wav=True)
+                if not self.auto_transcribe_var.get():
+                    mp3_file = convert_to_mp3(wav_file, delete_wav=True)
+                    self.root.after(0, lambda: (
+                        messagebox.showinfo(
+                            t('dialog.done'),
+                            tf('dialog.done_recording', file=mp3_file)
+                        ),
+                        self._open_in_explorer(mp3_file)
+                    ))
+                    return
+
+                # Encode the MP3 while Whisper reads the WAV directly, instead
+                # of decoding the freshly encoded MP3 again for transcription.
+                mp3_result = {}
 
-                if self.auto_transcribe_var.get():
+                def encode():
+                    try:
+                        mp3_result['path'] = convert_to_mp3(wav_file, delete_wav=False)
+                    except Exception as e:
+                        mp3_result['error'] = e
+
+                encoder = threading.Thread(target=encode, daemon=True)
+                encoder.start()
+
+                try:
                     self.root.after(0, lambda: self.status_var.set(t('status.transcribing')))
                     self.root.after(0, self._show_transcription_progress)
 
-                    def on_progress(percent):
-                        self.root.after(0, lambda p=percent: self._update_transcription_progress(p))
-
-                    def on_status(status_key):
-                        status_map = {
-                            'downloading_model': t('status.downloading_model'),
-                            'loading_model': t('status.loading_model'),
-                            'transcribing_gpu': t('status.transcribing_gpu'),
-                        }
-                        msg = status_map.get(status_key)
-                        if msg:
-                            self.root.after(0, lambda m=msg: self._show_indeterminate_progress(m))
-                        if status_key == 'model_ready':
-                            self.root.after(0, self._switch_to_determinate_progress)
-
                     lang_labels = self._get_language_labels()
                     language = lang_labels.get(self.lang_var.get())
                     txt_file = self.transcriber.transcribe(
-                        mp3_file,
+                        wav_file,
                         language=language,
-                        on_progress=on_progress,
-                        on_status=on_status
+                        on_progress=self._post_transcription_progress,
+                        on_status=self._post_transcription_status
                     )
+                finally:
+                    # Keep the MP3 even if transcription failed or was cancelled
+                    encoder.join()
+                    if 'error' not in mp3_result:
+                        Path(wav_file).unlink(missing_ok=True)
+                if 'error' in mp3_result:
+                    raise mp3_result['error']
+                mp3_file = mp3_result['path']
 
-                    self.root.after(0, lambda: (
-                        messagebox.showinfo(
-                            t('dialog.done'),
-                            t('dialog.done_recording_transcript', file=mp3_file, transcript=txt_file)
-                        ),
-                        self._open_in_explorer(txt_file)
-                    ))
-                else:
-                    self.root.after(0, lambda: (
-                        messagebox.showinfo(
-                            t('dialog.done'),
-                            t('dialog.done_recording', file=mp3_file)
-                        ),
-                        self._open_in_explorer(mp3_file)
-                    ))
+                self.root.after(0, lambda: (
+                    messagebox.showinfo(
+                        t('dialog.done'),
+                        tf('dialog.done_recording_transcript', file=mp3_file, transcript=txt_file)
+                    ),
+                    self._open_in_explorer(txt_file)
+                ))
 
             except RuntimeError as e:
                 error_msg = str(e)
@@ -950,23 +1142,23 @@ class RecordAndTranscribeApp:
                 else:
                     self.root.after(0, lambda msg=error_msg: messagebox.showerror(
                         t('dialog.error'),
-                        t('dialog.error_processing', error=msg)
+                        tf('dialog.error_processing', error=msg)
                     ))
             except Exception as e:
                 error_msg = str(e)
                 self.root.after(0, lambda msg=error_msg: messagebox.showerror(
                     t('dialog.error'),
-                    t('dialog.error_processing', error=msg)
+                    tf('dialog.error_processing', error=msg)
                 ))
             finally:
                 self.root.after(0, self._reset_ui)
 
-        threading.Thread(target=process, daemon=True).start()
+        self._transcribe_pool.submit(process)
 
     def _reset_ui(self):
         """Reset UI to ready state."""
         self.status_var.set(t('status.ready'))
-        self.duration_var.set(t('duration.label', time='00:00:00'))
+        self.duration_var.set(tf('duration.label', time='00:00:00'))
         self.record_btn.configure(text=t('button.start_recording'), state='normal', bg_color='#e74c3c', fg_color='#ffffff')
         self.mic_combo.config(state='readonly')
         self.sys_combo.config(state='readonly')
@@ -979,8 +1171,10 @@ class RecordAndTranscribeApp:
         self.is_transcribing = True
         self.trans_progress_bar.configure(mode='determinate')
         self.trans_progress_bar['value'] = 0
-        self.trans_progress_label.config(text=t('transcription.progress', percent=0))
+        self.trans_progress_label.config(text=tf('transcription.progress', percent=0))
         self.trans_progress_frame.pack(fill=tk.X, pady=(10, 0))
+        self._shown_percent = 0
+        self._pending_progress = None
 
     def _show_indeterminate_progress(self, status_text):
         """Show animated progress bar for model download/loading."""
@@ -989,21 +1183,57 @@ class RecordAndTranscribeApp:
         self.trans_progress_bar.start(15)
         self.trans_progress_label.config(text=status_text)
         self.trans_progress_frame.pack(fill=tk.X, pady=(10, 0))
+        self._shown_percent = None  # Indeterminate
 
     def _switch_to_determinate_progress(self):
         """Switch progress bar back to determinate mode after model is ready."""
         self.trans_progress_bar.stop()
         self.trans_progress_bar.configure(mode='determinate')
         self.trans_progress_bar['value'] = 0
-        self.trans_progress_label.config(text=t('transcription.progress', percent=0))
+        self.trans_progress_label.config(text=tf('transcription.progress', percent=0))
+        self._shown_percent = 0
+
+    def _post_transcription_progress(self, percent: int):
+        """Report progress from a worker thread.
+
+        Only the latest percent is kept; at most one drain is queued on the
+        Tk loop at a time, so a burst of updates costs a single redraw.
+        """
+        self._pending_progress = percent
+        if not self._progress_drain_queued:
+            self._progress_drain_queued = True
+            self.root.after(0, self._drain_transcription_progress)
+
+    def _drain_transcription_progress(self):
+        """Apply the most recently posted progress value (Tk thread)."""
+        self._progress_drain_queued = False
+        percent = self._pending_progress
+        if percent is not None:
+            self._update_transcription_progress(percent)
+
+    def _post_transcription_status(self, status_key: str):
+        """Report a transcriber status change from a worker thread."""
+        status_map = {
+            'downloading_model': t('status.downloading_model'),
+            'loading_model': t('status.loading_model'),
+            'transcribing_gpu': t('status.transcribing_gpu'),
+        }
+        msg = status_map.get(status_key)
+        if msg:
+            self.root.after(0, lambda m=msg: self._show_indeterminate_progress(m))
+        if status_key == 'model_ready':
+            self.root.after(0, self._switch_to_determinate_progress)
 
     def _update_transcription_progress(self, percent: int):
-        """Update transcription progress bar."""
-        if str(self.trans_progress_bar.cget('mode')) == 'indeterminate':
+        """Update transcription progress bar (no-op if the percent is already shown)."""
+        if percent == self._shown_percent:
+            return
+        if self._shown_percent is None:
             self.trans_progress_bar.stop()
             self.trans_progress_bar.configure(mode='determinate')
+        self._shown_percent = percent
         self.trans_progress_bar['value'] = percent
-        self.trans_progress_label.config(text=t('transcription.progress', percent=percent))
+        self.trans_progress_label.config(text=tf_id(K.TRANSCRIPTION_PROGRESS, percent=percent))
 
     def _cancel_transcription(self):
         """Cancel ongoing transcription."""
@@ -1013,20 +1243,30 @@ class RecordAndTranscribeApp:
             self._reset_ui()
 
     def _start_timer(self):
-        """Start the recording duration timer."""
-        def update_timer():
-            while self.is_recording:
-                elapsed = time.time() - self.recording_start_time
-                hours = int(elapsed // 3600)
-                minutes = int((elapsed % 3600) // 60)
-                seconds = int(elapsed % 60)
-                time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                self.duration_var.set(t('duration.label', time=time_str))
-                time.sleep(0.5)
-
-        self.timer_thread = threading.Thread(target=update_timer)
-        self.timer_thread.daemon = True
-        self.timer_thread.start()
+        """Start the recording duration timer on the Tk event loop."""
+        self._stop_timer()
+        self._tick()
+
+    def _stop_timer(self):
+        """Cancel the pending duration timer tick, if any."""
+        if self._timer_after_id is not None:
+            self.root.after_cancel(self._timer_after_id)
+            self._timer_after_id = None
+
+    def _tick(self):
+        """Update the duration label and schedule the next tick."""
+        self._timer_after_id = None
+        if not self.is_recording:
+            return
+        elapsed = time.monotonic() - self.recording_start_time
+        hours = int(elapsed // 3600)
+        minutes = int((elapsed % 3600) // 60)
+        seconds = int(elapsed % 60)
+        time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        self.duration_var.set(tf_id(K.DURATION_LABEL, time=time_str))
+        # Wake just after the next whole second so the display never skips
+        delay_ms = 1000 - int((elapsed % 1) * 1000) + 10
+        self._timer_after_id = self.root.after(delay_ms, self._tick)
 
     def _get_selected_devices(self):
         """Get currently selected device indices."""
@@ -1035,9 +1275,8 @@ class RecordAndTranscribeApp:
 
         mic_selection = self.mic_combo.current()
         if mic_selection > 0:
-            non_loopback_mics = [d for d in self.mic_devices if not d.get('is_loopback')]
-            if mic_selection - 1 < len(non_loopback_mics):
-                mic_index = non_loopback_mics[mic_selection - 1]['index']
+            if mic_selection - 1 < len(self._non_loopback_mics):
+                mic_index = self._non_loopback_mics[mic_selection - 1]['index']
 
         sys_selection = self.sys_combo.current()
         if sys_selection > 0:
@@ -1051,24 +1290,47 @@ class RecordAndTranscribeApp:
         if not self.is_recording:
             self._start_preview()
 
-    def _start_preview(self):
-        """Start audio preview for live level monitoring."""
-        mic_index, sys_index = self._get_selected_devices()
+    def _start_preview(self, force=False):
+        """Start audio preview for live level monitoring.
+
+        No-op if the preview is already running on the selected devices,
+        unless force is set; reopening PortAudio streams costs 50-200ms on
+        WASAPI.
+        """
+        devices = self._get_selected_devices()
+        if not force and devices == self._preview_devices and self.audio_capture.is_previewing:
+            return
+        mic_index, sys_index = devices
         self.audio_capture.start_preview(
             mic_device_index=mic_index,
             loopback_device_index=sys_index
         )
+        self._preview_devices = devices
 
     def _stop_preview(self):
         """Stop audio preview."""
         self.audio_capture.stop_preview()
+        self._preview_devices = None
+
+    @classmethod
+    def _level_changed(cls, level, shown):
+        """Return True if a meter showing `shown` should be redrawn at `level`."""
+        if level == shown:
+            return False
+        return level == 0 or abs(level - shown) > cls.LEVEL_DELTA
 
     def _update_audio_level_preview(self):
         """Update audio level meters."""
         mic_level, sys_level = self.audio_capture.get_current_level()
-        self.mic_level_bar['value'] = mic_level
-        self.sys_level_bar['value'] = sys_level
-        self.level_update_id = self.root.after(50, self._update_audio_level_preview)
+        # Only reconfigure a bar when its level moved noticeably (or fell
+        # silent); every configure forces a redraw of the progressbar.
+        if self._level_changed(mic_level, self._last_mic_shown):
+            self.mic_level_bar['value'] = mic_level
+            self._last_mic_shown = mic_level
+        if self._level_changed(sys_level, self._last_sys_shown):
+            self.sys_level_bar['value'] = sys_level
+            self._last_sys_shown = sys_level
+        self.level_update_id = self.root.after(self.LEVEL_INTERVAL_MS, self._update_audio_level_preview)
 
     def _transcribe_file(self):
         """Open file dialog and transcribe selected audio/video file."""
@@ -1090,35 +1352,18 @@ class RecordAndTranscribeApp:
         file_path = Path(file_path)
 
         self.status_var.set(t('status.transcribing'))
-        self.root.update()
+        self.root.update_idletasks()
 
         def process():
             try:
+                # Video files go straight to Whisper: its decoder (ffmpeg or
+                # PyAV) pulls the audio stream into memory itself, so there is
+                # no intermediate MP3 to encode and decode again.
                 audio_path = file_path
 
-                video_extensions = {'.mp4', '.mkv', '.avi', '.webm', '.mov'}
-                if file_path.suffix.lower() in video_extensions:
-                    self.root.after(0, lambda: self.status_var.set(t('status.extracting_audio')))
-                    audio_path = extract_audio_from_video(file_path)
-
                 self.root.after(0, lambda: self.status_var.set(t('status.transcribing')))
                 self.root.after(0, self._show_transcription_progress)
 
-                def on_progress(percent):
-                    self.root.after(0, lambda p=percent: self._update_transcription_progress(p))
-
-                def on_status(status_key):
-                    status_map = {
-                        'downloading_model': t('status.downloading_model'),
-                        'loading_model': t('status.loading_model'),
-                        'transcribing_gpu': t('status.transcribing_gpu'),
-                    }
-                    msg = status_map.get(status_key)
-                    if msg:
-                        self.root.after(0, lambda m=msg: self._show_indeterminate_progress(m))
-                    if status_key == 'model_ready':
-                        self.root.after(0, self._switch_to_determinate_progress)
-
                 lang_labels = self._get_language_labels()
                 language = lang_labels.get(self.lang_var.get())
                 output_dir = self.output_dir_var.get()
@@ -1127,14 +1372,14 @@ class RecordAndTranscribeApp:
                     audio_path,
                     language=language,
                     output_dir=output_dir,
-                    on_progress=on_progress,
-                    on_status=on_status
+                    on_progress=self._post_transcription_progress,
+                    on_status=self._post_transcription_status
                 )
 
                 self.root.after(0, lambda: (
                     messagebox.showinfo(
                         t('dialog.done'),
-                        t('dialog.done_transcription', file=txt_file)
+                        tf('dialog.done_transcription', file=txt_file)
                     ),
                     self._open_in_explorer(txt_file)
                 ))
@@ -1146,18 +1391,18 @@ class RecordAndTranscribeApp:
                 else:
                     self.root.after(0, lambda msg=error_msg: messagebox.showerror(
                         t('dialog.error'),
-                        t('dialog.error_transcription', error=msg)
+                        tf('dialog.error_transcription', error=msg)
                     ))
             except Exception as e:
                 error_msg = str(e)
                 self.root.after(0, lambda msg=error_msg: messagebox.showerror(
                     t('dialog.error'),
-                    t('dialog.error_transcription', error=msg)
+                    tf('dialog.error_transcription', error=msg)
                 ))
             finally:
                 self.root.after(0, self._reset_ui)
 
-        threading.Thread(target=process, daemon=True).start()
+        self._transcribe_pool.submit(process)
 
 
 def main():
@@ -1,12 +1,18 @@
 """
 Transcriber module for Record & Transcribe.
-Uses Whisper Python API with tqdm wrapper for real progress tracking.
+Uses faster-whisper (CTranslate2) when installed, otherwise the Whisper
+Python API with tqdm wrapper for real progress tracking.
 """
 
 import os
 import sys
+import importlib.util
+import json
+import shutil
 import threading
+import time
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 import subprocess
@@ -15,44 +21,31 @@ import subprocess
 import tqdm as tqdm_module
 
 
+class _NullWriter:
+    """File-like sink that discards everything, without opening os.devnull."""
+
+    def write(self, _text):
+        return 0
+
+    def flush(self):
+        pass
+
+
 class ProgressTqdm(tqdm_module.tqdm):
     """
     tqdm wrapper that calls a progress callback on each update.
     Whisper uses tqdm internally for its progress bar - we intercept that.
-    Also polls progress periodically in case update() isn't called often.
     """
     _callback: Optional[Callable[[int], None]] = None
     _last_percent: int = -1
-    _instance: Optional['ProgressTqdm'] = None
-    _poll_thread: Optional[threading.Thread] = None
-    _stop_polling: bool = False
-    _devnull: Optional[object] = None
+    _null_writer = _NullWriter()
 
     def __init__(self, *args, **kwargs):
         # pythonw.exe has sys.stderr=None, which crashes tqdm.
-        # Redirect output to devnull since we use callbacks instead.
+        # Discard its output since we use callbacks instead.
         if sys.stderr is None:
-            if ProgressTqdm._devnull is None:
-                ProgressTqdm._devnull = open(os.devnull, 'w')
-            kwargs.setdefault('file', ProgressTqdm._devnull)
+            kwargs.setdefault('file', ProgressTqdm._null_writer)
         super().__init__(*args, **kwargs)
-        ProgressTqdm._instance = self
-        ProgressTqdm._stop_polling = False
-        ProgressTqdm._poll_thread = threading.Thread(target=self._poll_progress, daemon=True)
-        ProgressTqdm._poll_thread.start()
-
-    def _poll_progress(self):
-        """Poll progress every 2 seconds and report it."""
-        import time
-        while not ProgressTqdm._stop_polling:
-            time.sleep(2)
-            if ProgressTqdm._instance and ProgressTqdm._callback:
-                inst = ProgressTqdm._instance
-                if inst.total and inst.total > 0:
-                    percent = int((inst.n / inst.total) * 100)
-                    if percent != ProgressTqdm._last_percent:
-                        ProgressTqdm._last_percent = percent
-                        ProgressTqdm._callback(percent)
 
     def update(self, n=1):
         super().update(n)
@@ -66,23 +59,117 @@ class ProgressTqdm(tqdm_module.tqdm):
                 ProgressTqdm._last_percent = percent
                 ProgressTqdm._callback(percent)
 
-    def close(self):
-        ProgressTqdm._stop_polling = True
-        ProgressTqdm._instance = None
-        super().close()
-
 
 logger = logging.getLogger(__name__)
 
 # Cache for system whisper GPU check result
 _system_whisper_gpu_cache: tuple[bool, str | None] | None = None
 
+# Positive results of check_whisper_installed / check_whisper_model_cached.
+# Only successes are cached: a missing install or model can appear while
+# the app is running (pip install, first download), a present one cannot
+# silently disappear.
+_whisper_installed_cache: bool = False
+_whisper_models_cached: set[str] = set()
+
+
+# System whisper GPU probes are persisted across launches, since each probe
+# imports torch in a subprocess (1-3 s). A negative result expires sooner so
+# a GPU setup done outside the app is picked up within the hour. The file
+# lives in the app's config dir, see set_gpu_probe_file().
+_GPU_PROBE_FILE: Path | None = None
+_GPU_PROBE_TTL = 24 * 3600
+_GPU_PROBE_NEGATIVE_TTL = 3600
+_GPU_PROBE_CANDIDATES = ('python', 'python3')  # in order of preference
+_GPU_PROBE_TIMEOUT = 5
+
+# Tail of the system whisper CLI's stderr kept for error messages
+_STDERR_TAIL_BYTES = 4096
+
+
+def set_gpu_probe_file(path: str | Path | None) -> None:
+    """Set where check_system_whisper_gpu persists its result (None disables)."""
+    global _GPU_PROBE_FILE
+    _GPU_PROBE_FILE = Path(path) if path is not None else None
+
+
+def invalidate_whisper_cache() -> None:
+    """Forget cached whisper/GPU probe results (e.g. after installing packages)."""
+    global _system_whisper_gpu_cache, _whisper_installed_cache
+    _system_whisper_gpu_cache = None
+    _whisper_installed_cache = False
+    _whisper_models_cached.clear()
+    if _GPU_PROBE_FILE is not None:
+        try:
+            _GPU_PROBE_FILE.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _gpu_probe_key() -> list:
+    """Identify the candidate interpreters by resolved path and mtime."""
+    key = []
+    for python_cmd in _GPU_PROBE_CANDIDATES:
+        path = shutil.which(python_cmd)
+        try:
+            mtime = os.stat(path).st_mtime if path else None
+        except OSError:
+            mtime = None
+        key.append([python_cmd, path, mtime])
+    return key
+
+
+def _load_gpu_probe() -> tuple[bool, str | None] | None:
+    """Return a still-valid persisted GPU probe result, if any."""
+    if _GPU_PROBE_FILE is None:
+        return None
+    try:
+        data = json.loads(_GPU_PROBE_FILE.read_text(encoding='utf-8'))
+        python_cmd = data['python']
+        ttl = _GPU_PROBE_TTL if python_cmd else _GPU_PROBE_NEGATIVE_TTL
+        if time.time() - data['time'] > ttl:
+            return None
+        if data['key'] != _gpu_probe_key():
+            return None
+        return (python_cmd is not None, python_cmd)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_gpu_probe(python_cmd: str | None) -> None:
+    """Persist a GPU probe result, None meaning no GPU (best effort, atomic)."""
+    if _GPU_PROBE_FILE is None:
+        return
+    try:
+        _GPU_PROBE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = _GPU_PROBE_FILE.with_suffix('.json.tmp')
+        tmp_file.write_text(json.dumps({
+            'python': python_cmd, 'key': _gpu_probe_key(), 'time': time.time()
+        }), encoding='utf-8')
+        os.replace(tmp_file, _GPU_PROBE_FILE)
+    except OSError:
+        pass
+
+
+def _spawn_gpu_probe(python_cmd: str) -> subprocess.Popen | None:
+    """Start a probe that prints True if whisper imports and torch sees CUDA."""
+    try:
+        return subprocess.Popen(
+            [python_cmd, '-c',
+             'import whisper, torch; print(torch.cuda.is_available())'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        )
+    except OSError:
+        return None
+
 
 def check_system_whisper_gpu() -> tuple[bool, str | None]:
     """
     Check if system Python has whisper + CUDA GPU available.
     Only checks when running as .exe (PyInstaller bundle).
-    Results are cached for the lifetime of the process.
+    Results are cached for the lifetime of the process and persisted
+    across launches (see set_gpu_probe_file).
 
     Returns:
         (available, python_path) - whether system whisper+GPU is available and the python path
@@ -97,23 +184,41 @@ def check_system_whisper_gpu() -> tuple[bool, str | None]:
         _system_whisper_gpu_cache = (False, None)
         return _system_whisper_gpu_cache
 
-    for python_cmd in ['python', 'python3']:
-        try:
-            result = subprocess.run(
-                [python_cmd, '-c',
-                 'import whisper, torch; print(torch.cuda.is_available())'],
-                capture_output=True, text=True, timeout=5,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-            )
-            if result.returncode == 0 and 'True' in result.stdout:
-                logger.info(f"System whisper+GPU detected via '{python_cmd}'")
-                _system_whisper_gpu_cache = (True, python_cmd)
-                return _system_whisper_gpu_cache
-        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-            continue
-
-    logger.info("No system whisper+GPU found")
-    _system_whisper_gpu_cache = (False, None)
+    persisted = _load_gpu_probe()
+    if persisted is not None:
+        _system_whisper_gpu_cache = persisted
+        return _system_whisper_gpu_cache
+
+    # Start all probes at once (worst case one timeout instead of one per
+    # candidate), then take the first success in preference order and
+    # kill the rest without waiting for them.
+    deadline = time.monotonic() + _GPU_PROBE_TIMEOUT
+    probes = [(cmd, _spawn_gpu_probe(cmd)) for cmd in _GPU_PROBE_CANDIDATES]
+    found = None
+    try:
+        for python_cmd, proc in probes:
+            if proc is None:
+                continue
+            # A probe that already exited is read even past the deadline
+            timeout = None if proc.poll() is not None else max(0.0, deadline - time.monotonic())
+            try:
+                stdout, _ = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                continue
+            if proc.returncode == 0 and 'True' in stdout:
+                found = python_cmd
+                break
+    finally:
+        for _, proc in probes:
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+
+    if found:
+        logger.info(f"System whisper+GPU detected via '{found}'")
+    else:
+        logger.info("No system whisper+GPU found")
+    _save_gpu_probe(found)
+    _system_whisper_gpu_cache = (found is not None, found)
     return _system_whisper_gpu_cache
 
 
@@ -131,20 +236,126 @@ class Transcriber:
         'Italian': 'Italian',
     }
 
+    # Whisper language name -> ISO code (faster-whisper expects codes)
+    LANGUAGE_CODES = {
+        'German': 'de',
+        'English': 'en',
+        'French': 'fr',
+        'Spanish': 'es',
+        'Italian': 'it',
+    }
+
     AVAILABLE_MODELS = ['tiny', 'base', 'small', 'medium', 'large']
 
-    def __init__(self, model: str = 'small'):
+    # faster-whisper quantization per device (CTranslate2 falls back to the
+    # closest type the hardware supports)
+    COMPUTE_TYPES = {
+        'cpu': 'int8',
+        'cuda': 'int8_float16',
+    }
+
+    def __init__(self, model: str = 'small', prefer_gpu: bool = True, compute_type: str | None = None):
         """
         Initialize transcriber.
 
         Args:
             model: Whisper model to use (tiny, base, small, medium, large)
+            prefer_gpu: Use CUDA/MPS (FP16) when available; False forces CPU
+            compute_type: faster-whisper quantization override (float32,
+                float16, int8_float16, int8); None picks per device
         """
         self.model_name = model
+        self.prefer_gpu = prefer_gpu
+        self.compute_type = compute_type
         self.model = None  # Lazy loading
+        self._device = 'cpu'  # Device the loaded model runs on
+        self._load_lock = threading.Lock()
+        self._warm = False
         self.is_transcribing = False
         self._cancelled = False
         self._process: subprocess.Popen | None = None
+        # Single worker for transcribe_async: jobs run one at a time, since
+        # a loaded model must not be used from two threads at once
+        self._jobs = ThreadPoolExecutor(max_workers=1, thread_name_prefix='transcriber')
+
+    def _load_model(self, WhisperModel):
+        """
+        Load self.model with faster-whisper if WhisperModel is given,
+        otherwise with openai-whisper, and return it. Caller must hold
+        self._load_lock.
+        """
+        try:
+            if WhisperModel is not None:
+                device = _faster_whisper_device(self.prefer_gpu)
+                compute_type = self.compute_type or self.COMPUTE_TYPES[device]
+                self.model = WhisperModel(
+                    self.model_name, device=device, compute_type=compute_type,
+                    cpu_threads=os.cpu_count() or 0
+                )
+            else:
+                import whisper
+                import torch
+                device = "cpu"
+                if self.prefer_gpu:
+                    if torch.cuda.is_available():
+                        device = "cuda"
+                    elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+                        device = "mps"
+                self.model = whisper.load_model(self.model_name, device=device)
+            self._device = device
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to load Whisper model '{self.model_name}': {e}"
+            )
+        return self.model
+
+    def set_prefer_gpu(self, prefer_gpu: bool) -> None:
+        """
+        Switch between GPU and CPU inference. Drops the loaded model so the
+        next transcription reloads it on the newly preferred device.
+        """
+        with self._load_lock:
+            if prefer_gpu == self.prefer_gpu:
+                return
+            self.prefer_gpu = prefer_gpu
+            self.model = None
+            self._warm = False
+
+    def preload(self) -> bool:
+        """
+        Load the model and run a 1-second silent inference so the first real
+        transcription skips the cold start (model load, kernel selection).
+        Meant to run in a background thread. Only uses an already downloaded
+        model - never starts a download.
+
+        Returns:
+            True if the model is loaded and warmed up
+        """
+        # The system whisper CLI loads its own model per call
+        if self.prefer_gpu and hasattr(sys, '_MEIPASS') and check_system_whisper_gpu()[0]:
+            return False
+        if not check_whisper_installed() or not check_whisper_model_cached(self.model_name):
+            return False
+
+        import numpy as np
+        silence = np.zeros(16000, dtype=np.float32)
+        WhisperModel = _load_faster_whisper()
+        try:
+            with self._load_lock:
+                model = self.model or self._load_model(WhisperModel)
+                if self._warm or self.is_transcribing:
+                    return self._warm
+                if WhisperModel is not None:
+                    segments, _ = model.transcribe(silence, language='en', beam_size=1)
+                    for _ in segments:
+                        pass
+                else:
+                    model.transcribe(silence, language='en', verbose=None, fp16=self._device != 'cpu')
+                self._warm = True
+        except Exception as e:
+            logger.info(f"Whisper preload failed: {e}")
+            return False
+        return True
 
     def _transcribe_via_system(
         self,
@@ -185,28 +396,43 @@ class Transcriber:
         try:
             self._process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
                 creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
             )
+            # cancel() may have run before the process existed
+            if self._cancelled:
+                self._process.terminate()
+
+            # Drain stderr on a reader thread so whisper's progress output
+            # can't fill the pipe and stall the child; only the tail is kept
+            # for the error message instead of buffering the whole run.
+            # Raw bytes rather than lines: tqdm redraws with '\r', so a
+            # "line" can span the entire run.
+            stderr_pipe = self._process.stderr
+            stderr_tail = bytearray()
 
-            # Wait for completion, checking for cancellation
-            while self._process.poll() is None:
-                if self._cancelled:
-                    self._process.terminate()
-                    try:
-                        self._process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        self._process.kill()
-                    raise RuntimeError("Transcription cancelled")
-                # Brief sleep to avoid busy-waiting
-                import time
-                time.sleep(0.5)
+            def drain_stderr():
+                for chunk in iter(lambda: stderr_pipe.read1(4096), b''):
+                    stderr_tail.extend(chunk)
+                    del stderr_tail[:-_STDERR_TAIL_BYTES]
+
+            reader = threading.Thread(target=drain_stderr, daemon=True)
+            reader.start()
+
+            # Block until the process exits; cancel() terminates it, which
+            # ends the wait.
+            self._process.wait()
+            reader.join()
+            stderr_pipe.close()
+
+            if self._cancelled:
+                raise RuntimeError("Transcription cancelled")
 
             if self._process.returncode != 0:
-                stderr = self._process.stderr.read() if self._process.stderr else ''
-                raise RuntimeError(f"System whisper failed (exit {self._process.returncode}): {stderr[-500:]}")
+                # Decode only the tail, and only on failure
+                stderr = bytes(stderr_tail[-500:]).decode('utf-8', 'replace')
+                raise RuntimeError(f"System whisper failed (exit {self._process.returncode}): {stderr}")
 
             if on_progress:
                 on_progress(100)
@@ -224,6 +450,89 @@ class Transcriber:
             self._process = None
             self.is_transcribing = False
 
+    def _transcribe_faster(
+        self,
+        WhisperModel,
+        audio_path: Path,
+        language: str | None,
+        output_format: str,
+        output_dir: Path | None,
+        callback: Optional[Callable[[str], None]],
+        on_progress: Optional[Callable[[int], None]],
+        on_status: Optional[Callable[[str], None]]
+    ) -> Path:
+        """
+        Transcribe using faster-whisper (CTranslate2).
+        Runs int8 on CPU and int8_float16 on CUDA, several times faster than
+        the PyTorch reference implementation on the same model.
+        """
+        try:
+            # The lock waits out a preload() that is still loading the model.
+            # Keep a local reference: set_prefer_gpu() may drop self.model
+            # while this transcription runs.
+            with self._load_lock:
+                model = self.model
+                if model is None:
+                    if not check_whisper_model_cached(self.model_name) and on_status:
+                        on_status('downloading_model')
+                    elif on_status:
+                        on_status('loading_model')
+                    model = self._load_model(WhisperModel)
+                    if on_status:
+                        on_status('model_ready')
+
+            segments, info = model.transcribe(
+                str(audio_path),
+                language=self.LANGUAGE_CODES.get(language),
+                beam_size=1,
+                vad_filter=True,
+                # Drop pauses of half a second or more, not just long gaps
+                vad_parameters=dict(min_silence_duration_ms=500)
+            )
+
+            if output_dir:
+                output_dir = Path(output_dir)
+                output_dir.mkdir(parents=True, exist_ok=True)
+                output_path = output_dir / f"{audio_path.stem}.{output_format}"
+            else:
+                output_path = audio_path.with_suffix(f'.{output_format}')
+
+            # Segments are decoded lazily as the generator is consumed; write
+            # each one as it arrives and derive progress from its end time.
+            # They go to a .part file that replaces the transcript only once
+            # complete, so a cancel or decode error never leaves a truncated
+            # transcript behind or clobbers an existing one.
+            part_path = output_path.with_suffix(f'.{output_format}.part')
+            last_percent = -1
+            try:
+                with open(part_path, 'w', encoding='utf-8') as f:
+                    separator = ''
+                    for segment in segments:
+                        if self._cancelled:
+                            raise RuntimeError("Transcription cancelled")
+                        f.write(separator + segment.text.strip())
+                        separator = ' '
+                        if on_progress and info.duration:
+                            percent = min(99, int(100 * segment.end / info.duration))
+                            if percent != last_percent:
+                                last_percent = percent
+                                on_progress(percent)
+                os.replace(part_path, output_path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+
+            if on_progress:
+                on_progress(100)
+
+            if callback:
+                callback(str(output_path))
+
+            return output_path
+
+        finally:
+            self.is_transcribing = False
+
     def transcribe(
         self,
         audio_path: str | Path,
@@ -258,7 +567,7 @@ class Transcriber:
         self._cancelled = False
 
         # In .exe mode, delegate to system whisper if GPU is available
-        if hasattr(sys, '_MEIPASS'):
+        if self.prefer_gpu and hasattr(sys, '_MEIPASS'):
             gpu_available, _ = check_system_whisper_gpu()
             if gpu_available:
                 return self._transcribe_via_system(
@@ -266,49 +575,54 @@ class Transcriber:
                     output_dir, callback, on_progress, on_status
                 )
 
-        import whisper
+        # Prefer the CTranslate2 backend when installed
+        WhisperModel = _load_faster_whisper()
+        if WhisperModel is not None:
+            return self._transcribe_faster(
+                WhisperModel, audio_path, language, output_format,
+                output_dir, callback, on_progress, on_status
+            )
 
-        # Install tqdm wrapper BEFORE model loading so download progress is captured
-        original_tqdm = tqdm_module.tqdm
-        ProgressTqdm._callback = on_progress
-        ProgressTqdm._last_percent = -1
-        tqdm_module.tqdm = ProgressTqdm
+        import whisper
 
+        # Install tqdm wrapper BEFORE model loading so download progress is captured.
+        # Without a listener whisper keeps its plain tqdm.
+        original_tqdm = None
         whisper_transcribe_mod = sys.modules.get('whisper.transcribe')
         original_whisper_tqdm = None
-        if whisper_transcribe_mod and hasattr(whisper_transcribe_mod, 'tqdm'):
-            original_whisper_tqdm = whisper_transcribe_mod.tqdm.tqdm
-            whisper_transcribe_mod.tqdm.tqdm = ProgressTqdm
+        if on_progress is not None:
+            original_tqdm = tqdm_module.tqdm
+            ProgressTqdm._callback = on_progress
+            ProgressTqdm._last_percent = -1
+            tqdm_module.tqdm = ProgressTqdm
+
+            if whisper_transcribe_mod and hasattr(whisper_transcribe_mod, 'tqdm'):
+                original_whisper_tqdm = whisper_transcribe_mod.tqdm.tqdm
+                whisper_transcribe_mod.tqdm.tqdm = ProgressTqdm
 
         # Lazy load model (with tqdm wrapper active for download progress)
-        if self.model is None:
-            model_cached = check_whisper_model_cached(self.model_name)
-            if not model_cached and on_status:
-                on_status('downloading_model')
-            elif on_status:
-                on_status('loading_model')
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    device = "cuda"
-                elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-                    device = "mps"
-                else:
-                    device = "cpu"
-                self.model = whisper.load_model(self.model_name, device=device)
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to load Whisper model '{self.model_name}': {e}"
-                )
-            if on_status:
-                on_status('model_ready')
-            ProgressTqdm._last_percent = -1
+        # Local model/device references: set_prefer_gpu() may drop
+        # self.model while this transcription runs
+        with self._load_lock:
+            model = self.model
+            if model is None:
+                model_cached = check_whisper_model_cached(self.model_name)
+                if not model_cached and on_status:
+                    on_status('downloading_model')
+                elif on_status:
+                    on_status('loading_model')
+                model = self._load_model(None)
+                if on_status:
+                    on_status('model_ready')
+                ProgressTqdm._last_percent = -1
+            device = self._device
 
         try:
-            result = self.model.transcribe(
+            result = model.transcribe(
                 str(audio_path),
                 language=language,
-                verbose=False
+                verbose=False,
+                fp16=device != 'cpu'
             )
 
             if self._cancelled:
@@ -332,8 +646,9 @@ class Transcriber:
             return output_path
 
         finally:
-            tqdm_module.tqdm = original_tqdm
-            ProgressTqdm._callback = None
+            if original_tqdm is not None:
+                tqdm_module.tqdm = original_tqdm
+                ProgressTqdm._callback = None
 
             if original_whisper_tqdm is not None:
                 whisper_transcribe_mod.tqdm.tqdm = original_whisper_tqdm
@@ -347,10 +662,12 @@ class Transcriber:
         output_format: str = 'txt',
         on_complete: Optional[Callable[[Path], None]] = None,
         on_error: Optional[Callable[[str], None]] = None
-    ) -> threading.Thread:
+    ) -> Future:
         """
         Transcribe audio file asynchronously.
 
+        Jobs are queued on this transcriber's worker thread and run in order.
+
         Args:
             audio_path: Path to audio file
             language: Language of the audio
@@ -359,108 +676,133 @@ class Transcriber:
             on_error: Callback when error occurs
 
         Returns:
-            Thread object handling the transcription
+            Future resolving to the output path (exceptions are reported to
+            on_error and re-raised into the future)
         """
         def run():
             try:
                 result = self.transcribe(audio_path, language, output_format)
-                if on_complete:
-                    on_complete(result)
             except Exception as e:
                 if on_error:
                     on_error(str(e))
+                raise
+            if on_complete:
+                on_complete(result)
+            return result
 
-        thread = threading.Thread(target=run)
-        thread.start()
-        return thread
+        return self._jobs.submit(run)
 
     def cancel(self):
         """Cancel ongoing transcription."""
         self._cancelled = True
         self.is_transcribing = False
         # Terminate system whisper subprocess if running
-        if self._process is not None:
+        process = self._process
+        if process is not None:
             try:
-                self._process.terminate()
+                process.terminate()
             except OSError:
                 pass
 
 
-def extract_audio_from_video(video_path: str | Path, output_format: str = 'mp3') -> Path:
-    """
-    Extract audio from video file using ffmpeg.
+def _load_faster_whisper():
+    """Return faster_whisper.WhisperModel if faster-whisper is installed, else None."""
+    try:
+        from faster_whisper import WhisperModel
+        return WhisperModel
+    except ImportError:
+        return None
 
-    Args:
-        video_path: Path to video file (mp4, mkv, avi, etc.)
-        output_format: Output audio format (mp3, wav)
 
-    Returns:
-        Path to extracted audio file
-    """
-    video_path = Path(video_path)
-    audio_path = video_path.with_suffix(f'.{output_format}')
-
-    cmd = [
-        'ffmpeg',
-        '-i', str(video_path),
-        '-vn',
-        '-acodec', 'libmp3lame' if output_format == 'mp3' else 'pcm_s16le',
-        '-q:a', '4',
-        '-y',
-        str(audio_path)
-    ]
+def _faster_whisper_device(prefer_gpu: bool = True) -> str:
+    """Pick the faster-whisper device: 'cuda' if preferred and available, else 'cpu'."""
+    if prefer_gpu:
+        try:
+            import ctranslate2
+            if ctranslate2.get_cuda_device_count() > 0:
+                return 'cuda'
+        except Exception:
+            pass
+    return 'cpu'
+
 
+def _module_available(name: str) -> bool:
+    """Check whether a top-level module can be found, without importing it."""
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return audio_path
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Audio extraction failed: {e.stderr}")
-    except FileNotFoundError:
-        raise RuntimeError("ffmpeg not found. Please install ffmpeg or place ffmpeg.exe in bundled_ffmpeg/.")
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
 
 def check_whisper_installed() -> bool:
-    """Check if Whisper is installed and available."""
-    try:
-        import whisper
+    """
+    Check if a Whisper backend (faster-whisper or openai-whisper) is available
+    (positive result cached). Only looks the packages up, so it is safe to
+    call on the Tk thread: importing whisper pulls in torch.
+    """
+    global _whisper_installed_cache
+    if _whisper_installed_cache:
         return True
-    except ImportError:
+    if _module_available('faster_whisper') or _module_available('whisper'):
+        _whisper_installed_cache = True
+        return True
+    return False
+
+
+# Minimum expected model file sizes in bytes (approximate), to tell a
+# complete download from a partial one
+_MODEL_MIN_SIZES = {
+    'tiny': 70_000_000,
+    'base': 130_000_000,
+    'small': 450_000_000,
+    'medium': 1_400_000_000,
+    'large': 2_800_000_000,
+}
+
+
+def _hf_hub_cache_dir() -> Path:
+    """Hugging Face hub cache directory, resolved like huggingface_hub does."""
+    hub_cache = os.getenv('HF_HUB_CACHE') or os.getenv('HUGGINGFACE_HUB_CACHE')
+    if hub_cache:
+        return Path(hub_cache).expanduser()
+    default_cache = os.path.join(os.path.expanduser("~"), ".cache")
+    hf_home = os.getenv('HF_HOME') or os.path.join(os.getenv("XDG_CACHE_HOME", default_cache), "huggingface")
+    return Path(hf_home).expanduser() / 'hub'
+
+
+def _model_file_complete(path: str | Path, model_name: str) -> bool:
+    """Check that a model file exists and is not a partial download."""
+    try:
+        file_size = os.stat(path).st_size
+    except OSError:
         return False
+    return file_size >= _MODEL_MIN_SIZES.get(model_name, 50_000_000)
 
 
 def check_whisper_model_cached(model_name: str = 'small') -> bool:
-    """Check if the Whisper model is already downloaded and complete."""
-    # Minimum expected file sizes in bytes (approximate)
-    MODEL_MIN_SIZES = {
-        'tiny': 70_000_000,
-        'base': 130_000_000,
-        'small': 450_000_000,
-        'medium': 1_400_000_000,
-        'large': 2_800_000_000,
-    }
-    try:
-        import whisper
-        import os
-        url = whisper._MODELS.get(model_name)
-        if url is None:
-            return False
-        # Check default cache location
+    """
+    Check if the Whisper model is already downloaded and complete (positive
+    result cached). Inspects the download caches directly instead of
+    importing the backend.
+    """
+    if model_name in _whisper_models_cached:
+        return True
+    if _module_available('faster_whisper'):
+        # faster-whisper models live in the Hugging Face hub cache as
+        # models--Systran--faster-whisper-<name>/snapshots/<rev>/model.bin
+        repo_dir = _hf_hub_cache_dir() / f'models--Systran--faster-whisper-{model_name}'
+        cached = any(
+            _model_file_complete(model_file, model_name)
+            for model_file in repo_dir.glob('snapshots/*/model.bin')
+        )
+    else:
+        # openai-whisper keeps <name>.pt in ~/.cache/whisper
         default_cache = os.path.join(os.path.expanduser("~"), ".cache")
         download_root = os.path.join(os.getenv("XDG_CACHE_HOME", default_cache), "whisper")
-        expected = os.path.join(download_root, os.path.basename(url))
-        if not os.path.exists(expected):
-            return False
-        # Verify file is not incomplete (partial download)
-        file_size = os.path.getsize(expected)
-        min_size = MODEL_MIN_SIZES.get(model_name, 50_000_000)
-        return file_size >= min_size
-    except Exception:
-        return False
+        cached = _model_file_complete(os.path.join(download_root, f'{model_name}.pt'), model_name)
+    if cached:
+        _whisper_models_cached.add(model_name)
+    return cached
 
 
 if __name__ == "__main__":
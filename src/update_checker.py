@@ -4,23 +4,36 @@ Checks GitHub releases for newer versions and downloads the installer.
 """
 
 import re
+import shutil
 import tempfile
-import threading
 import urllib.request
 import urllib.error
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 GITHUB_REPO = "conversiontraffic/record-and-transcribe"
 API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 API_TIMEOUT = 5
 DOWNLOAD_TIMEOUT = 120
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB reads for the installer download
+# Fixed download location; stale files are removed before each download
+# so old installers don't pile up in %TEMP%
+UPDATE_DIR = Path(tempfile.gettempdir()) / 'rt_update'
 
+_VERSION_RE = re.compile(r'v?(\d+)\.(\d+)\.(\d+)')
 
+# One worker for the whole update cycle: the check and the download that
+# follows it run in order on the same thread instead of two new ones.
+_UPDATE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rt-update')
+
+
+@lru_cache(maxsize=64)
 def parse_version(version_str: str) -> tuple:
     """Parse a version string like 'v0.1.0' or '0.1.0' into a tuple of ints."""
-    match = re.match(r'v?(\d+)\.(\d+)\.(\d+)', version_str)
+    match = _VERSION_RE.match(version_str)
     if not match:
         return (0, 0, 0)
     return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
@@ -42,12 +55,15 @@ def _find_setup_asset(assets: list) -> dict | None:
 
 def check_for_updates(current_version: str, callback):
     """
-    Check GitHub for a newer release in a background thread.
+    Check GitHub for a newer release on the update worker thread.
 
     Args:
         current_version: Current app version (e.g. "0.1.0")
         callback: Function called with (version, download_url, asset_name) if update found,
                   or (None, None, None) if no update or error.
+
+    Returns:
+        Future of the check.
     """
     def _check():
         try:
@@ -56,7 +72,7 @@ def check_for_updates(current_version: str, callback):
                 'User-Agent': 'RecordAndTranscribe-UpdateChecker'
             })
             with urllib.request.urlopen(req, timeout=API_TIMEOUT) as resp:
-                data = json.loads(resp.read().decode('utf-8'))
+                data = json.loads(resp.read())
 
             # Skip pre-releases
             if data.get('prerelease', False) or data.get('draft', False):
@@ -83,36 +99,63 @@ def check_for_updates(current_version: str, callback):
         except Exception:
             callback(None, None, None)
 
-    thread = threading.Thread(target=_check, daemon=True)
-    thread.start()
-    return thread
+    return _UPDATE_POOL.submit(_check)
+
+
+def _clean_update_dir(keep: str):
+    """Remove stale partial downloads and other installers from UPDATE_DIR.
+
+    The file named keep is left alone, as is anything that can't be
+    removed (e.g. a previous installer that is still running).
+    """
+    for entry in UPDATE_DIR.iterdir():
+        if entry.name == keep:
+            continue
+        try:
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+        except OSError:
+            pass
 
 
 def download_update(url: str, filename: str, on_complete, on_error=None):
     """
-    Download the update installer in a background thread.
+    Download the update installer on the update worker thread.
 
     Args:
         url: Download URL for the setup .exe
         filename: Name of the file to save
         on_complete: Called with the local file path when done
         on_error: Called on failure (optional)
+
+    Returns:
+        Future of the download.
     """
     def _download():
         try:
-            temp_dir = tempfile.mkdtemp(prefix='rt_update_')
-            dest_path = os.path.join(temp_dir, filename)
+            UPDATE_DIR.mkdir(parents=True, exist_ok=True)
+            dest_path = os.path.join(UPDATE_DIR, filename)
+            part_path = dest_path + '.part'
+            _clean_update_dir(keep=filename)
 
             req = urllib.request.Request(url, headers={
                 'User-Agent': 'RecordAndTranscribe-UpdateChecker'
             })
             with urllib.request.urlopen(req, timeout=DOWNLOAD_TIMEOUT) as resp:
-                with open(dest_path, 'wb') as f:
-                    while True:
-                        chunk = resp.read(8192)
-                        if not chunk:
-                            break
-                        f.write(chunk)
+                # An earlier check may already have fetched this installer
+                # (and be offering it right now); reuse it if complete
+                expected_size = resp.headers.get('Content-Length')
+                try:
+                    existing_size = os.path.getsize(dest_path)
+                except OSError:
+                    existing_size = None
+                if existing_size is None or str(existing_size) != expected_size:
+                    with open(part_path, 'wb') as f:
+                        shutil.copyfileobj(resp, f, length=DOWNLOAD_CHUNK_SIZE)
+                    # Only a complete download ever appears under the final name
+                    os.replace(part_path, dest_path)
 
             on_complete(dest_path)
 
@@ -120,6 +163,4 @@ def download_update(url: str, filename: str, on_complete, on_error=None):
             if on_error:
                 on_error(str(e))
 
-    thread = threading.Thread(target=_download, daemon=True)
-    thread.start()
-    return thread
+    return _UPDATE_POOL.submit(_download)
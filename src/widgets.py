@@ -2,6 +2,7 @@
 
 import sys
 import tkinter as tk
+from functools import lru_cache
 
 _DEFAULT_FONT = 'Helvetica Neue' if sys.platform == 'darwin' else 'Segoe UI'
 
@@ -25,6 +26,11 @@ class RoundedButton(tk.Canvas):
         self._font = font or (_DEFAULT_FONT, 10)
         self._state = 'normal'
         self._pressed = False
+        self._poly_id = None
+        self._text_id = None
+        self._points = None
+        self._w = 0
+        self._pending_redraw = None
 
         self._update_canvas_bg()
 
@@ -42,18 +48,21 @@ class RoundedButton(tk.Canvas):
         except Exception:
             pass
 
-    def _rounded_rect(self, x1, y1, x2, y2, r, **kwargs):
-        """Draw a rounded rectangle on the canvas."""
-        points = [
+    @staticmethod
+    def _rounded_rect_points(x1, y1, x2, y2, r):
+        """Polygon points for a smoothed rounded rectangle."""
+        return (
             x1 + r, y1, x2 - r, y1, x2, y1, x2, y1 + r,
             x2, y2 - r, x2, y2, x2 - r, y2, x1 + r, y2,
             x1, y2, x1, y2 - r, x1, y1 + r, x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+        )
 
     def _draw(self, override_color=None):
-        """Redraw the button."""
-        self.delete('all')
+        """Redraw the button.
+
+        The polygon and text items are created once and then updated in
+        place; coordinates are only recomputed when the width changes.
+        """
         w = self.winfo_width()
         h = self._height
         if w <= 1:
@@ -66,31 +75,57 @@ class RoundedButton(tk.Canvas):
             color = self._adjust_color(color, darken=0.4)
             fg = self._adjust_color(fg, darken=0.3)
 
-        r = min(self._corner_radius, h // 2)
-        self._rounded_rect(1, 1, w - 1, h - 1, r, fill=color, outline='')
-        self.create_text(w / 2, h / 2, text=self._text,
-                         fill=fg, font=self._font)
+        if self._poly_id is None:
+            r = min(self._corner_radius, h // 2)
+            self._points = self._rounded_rect_points(1, 1, w - 1, h - 1, r)
+            self._w = w
+            self._poly_id = self.create_polygon(
+                self._points, smooth=True, fill=color, outline='')
+            self._text_id = self.create_text(w / 2, h / 2, text=self._text,
+                                             fill=fg, font=self._font)
+            return
+
+        if w != self._w:
+            r = min(self._corner_radius, h // 2)
+            self._points = self._rounded_rect_points(1, 1, w - 1, h - 1, r)
+            self._w = w
+            self.coords(self._poly_id, *self._points)
+            self.coords(self._text_id, w / 2, h / 2)
+
+        self.itemconfigure(self._poly_id, fill=color)
+        self.itemconfigure(self._text_id, text=self._text, fill=fg)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _adjust_color(color, lighten=0.0, darken=0.0):
-        """Lighten or darken a hex color."""
+        """Lighten or darken a hex color (memoized, the palette is small)."""
+        if len(color) != 7:
+            return color
         try:
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
+            rgb = int(color[1:], 16)
+            r, g, b = rgb >> 16 & 0xff, rgb >> 8 & 0xff, rgb & 0xff
+            # Fixed-point weights out of 256 keep the math in integers
             if lighten:
-                r = min(255, int(r + (255 - r) * lighten))
-                g = min(255, int(g + (255 - g) * lighten))
-                b = min(255, int(b + (255 - b) * lighten))
+                n = round(lighten * 256)
+                r += (255 - r) * n >> 8
+                g += (255 - g) * n >> 8
+                b += (255 - b) * n >> 8
             if darken:
-                r = max(0, int(r * (1 - darken)))
-                g = max(0, int(g * (1 - darken)))
-                b = max(0, int(b * (1 - darken)))
-            return f'#{r:02x}{g:02x}{b:02x}'
+                n = 256 - round(darken * 256)
+                r = r * n >> 8
+                g = g * n >> 8
+                b = b * n >> 8
+            return '#%06x' % (r << 16 | g << 8 | b)
         except Exception:
             return color
 
     def _on_configure(self, _event):
+        # Coalesce the burst of events fired while the window is dragged
+        if self._pending_redraw is None:
+            self._pending_redraw = self.after(16, self._do_redraw)
+
+    def _do_redraw(self):
+        self._pending_redraw = None
         self._draw()
 
     def _on_enter(self, _event):
@@ -139,6 +174,12 @@ class RoundedButton(tk.Canvas):
 
     config = configure
 
+    def destroy(self):
+        if self._pending_redraw is not None:
+            self.after_cancel(self._pending_redraw)
+            self._pending_redraw = None
+        super().destroy()
+
     def update_theme_bg(self):
         """Refresh canvas background after theme change."""
         self._update_canvas_bg()